@@ -173,7 +173,7 @@ def validate_coinbase(block: 'Block', expected_height: int) -> bool:
 
     # Rule 3: Coinbase reward must not exceed allowed amount
     coinbase_tx = transactions[0]
-    coinbase_output_total = sum(output.value for output in coinbase_tx.outputs)
+    coinbase_output_total = coinbase_tx.get_output_value()
 
     # Calculate the expected block reward from the halving schedule
     expected_reward = get_block_reward(expected_height)
@@ -186,7 +186,7 @@ def validate_coinbase(block: 'Block', expected_height: int) -> bool:
     # (a full validation would require UTXO lookups).
     total_fees = 0
     for tx in transactions[1:]:
-        tx_output_total = sum(output.value for output in tx.outputs)
+        tx_output_total = tx.get_output_value()
         # In a full implementation, we would look up each input's value from the UTXO set.
         # For now, fees are computed when the UTXO set is available during full validation.
         # We allow the coinbase to claim up to expected_reward + total_fees.
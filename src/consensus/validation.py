@@ -45,9 +45,12 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import FIRST_EXCEPTION, wait
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from src.core.block import Block
     from src.core.transaction import Transaction
     from src.core.utxo import UTXOSet
@@ -164,9 +167,13 @@ def validate_block(block: "Block", blockchain: object) -> bool:
     # 7. Validate all transactions in the block
     # ---------------------------------------------------------------
     coinbase_maturity = getattr(blockchain, '_coinbase_maturity', 100)
+    validator_pool = getattr(blockchain, '_validator_pool', None)
     if not is_genesis:
         try:
-            validate_block_transactions(block, blockchain.utxo_set, expected_height, coinbase_maturity)
+            validate_block_transactions(
+                block, blockchain.utxo_set, expected_height, coinbase_maturity,
+                executor=validator_pool,
+            )
         except ValidationError:
             raise
         except ValueError as e:
@@ -209,6 +216,7 @@ def validate_block_transactions(
     utxo_set: "UTXOSet",
     block_height: int,
     coinbase_maturity: int = 100,
+    executor: "Executor | None" = None,
 ) -> bool:
     """
     Validate every transaction in a block against the UTXO set.
@@ -224,14 +232,21 @@ def validate_block_transactions(
       crypto module is unavailable).
     - The sum of outputs does not exceed the sum of inputs.
 
-    A temporary copy of the UTXO set is used to track spending within the
+    A copy-on-write view of the UTXO set is used to track spending within the
     block so that intra-block double-spends are detected.
 
+    The UTXO checks depend on transaction order and run sequentially. When
+    an *executor* is given, signature checks are submitted to it instead,
+    each against a snapshot of the outputs its transaction spends, and the
+    first failure cancels the remaining ones.
+
     Args:
         block: The block whose transactions are being validated.
         utxo_set: The current UTXO set (before this block is applied).
         block_height: The height at which this block will be placed.
         coinbase_maturity: Required confirmations for coinbase outputs.
+        executor: Optional executor for running signature checks in
+            parallel.
 
     Returns:
         True if all transactions are valid.
@@ -239,39 +254,64 @@ def validate_block_transactions(
     Raises:
         ValidationError: If any transaction fails validation.
     """
-    # Work on a copy so we can track intra-block spending
+    # Work on a copy-on-write view so we can track intra-block spending
+    # without copying the whole UTXO set
     try:
-        working_utxo = utxo_set.copy()
+        working_utxo = utxo_set.overlay()
     except Exception:
         working_utxo = utxo_set
 
+    parallel = executor is not None and len(block.transactions) > 2
+    signature_jobs = []
+
     for i, tx in enumerate(block.transactions):
         # Skip coinbase
         if i == 0 and tx.is_coinbase():
             continue
 
         try:
-            validate_transaction(tx, working_utxo, block_height, coinbase_maturity)
+            validate_transaction(
+                tx, working_utxo, block_height, coinbase_maturity,
+                check_signatures=not parallel,
+            )
         except ValidationError as e:
             raise ValidationError(
                 f"Transaction {tx.txid[:16]} at index {i} failed validation: {e}"
             )
 
+        if parallel:
+            # Snapshot the spent outputs before they leave the working set
+            spent = [
+                working_utxo.get_utxo(inp.previous_txid, inp.previous_output_index)
+                for inp in tx.inputs
+            ]
+            signature_jobs.append((i, tx, spent))
+
         # Remove spent UTXOs from working set so subsequent txs in the same
         # block cannot double-spend them.
         for inp in tx.inputs:
             if not inp.is_coinbase():
-                try:
-                    working_utxo.remove_utxo(inp.previous_txid, inp.previous_output_index)
-                except Exception:
-                    pass
+                working_utxo.remove_utxo_if_present(inp.previous_txid, inp.previous_output_index)
 
         # Add new UTXOs created by this transaction
         for idx, output in enumerate(tx.outputs):
-            try:
-                working_utxo.add_utxo(tx.txid, idx, output, block_height, is_coinbase=False)
-            except Exception:
-                pass
+            working_utxo.add_utxo(tx.txid, idx, output, block_height, is_coinbase=False)
+
+    if signature_jobs:
+        futures = {
+            executor.submit(_validate_spent_signatures, tx, spent): (i, tx)
+            for i, tx, spent in signature_jobs
+        }
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                i, tx = futures[future]
+                raise ValidationError(
+                    f"Transaction {tx.txid[:16]} at index {i} failed validation: {error}"
+                )
 
     return True
 
@@ -285,6 +325,7 @@ def validate_transaction(
     utxo_set: "UTXOSet",
     current_height: int = 0,
     coinbase_maturity: int = 100,
+    check_signatures: bool = True,
 ) -> bool:
     """
     Validate a standalone (non-coinbase) transaction.
@@ -303,6 +344,8 @@ def validate_transaction(
         current_height: The height of the block being validated (used for
             coinbase maturity checks).
         coinbase_maturity: Required confirmations for coinbase outputs.
+        check_signatures: If False, skip step 5 (the caller verifies the
+            signatures separately, e.g. in parallel).
 
     Returns:
         True if the transaction is valid.
@@ -347,17 +390,11 @@ def validate_transaction(
         total_input_value += utxo.value
 
     # 5. Signature validation (best-effort)
-    for i, _ in enumerate(tx.inputs):
-        try:
-            if not validate_transaction_signature(tx, i, utxo_set):
-                raise ValidationError(f"Invalid signature for input {i}")
-        except ValidationError:
-            raise
-        except Exception as e:
-            logger.warning("Signature validation error for input %d: %s", i, e)
+    if check_signatures:
+        validate_transaction_signatures(tx, utxo_set)
 
     # 6. Output values must not exceed input values (conservation of value)
-    total_output_value = sum(out.value for out in tx.outputs)
+    total_output_value = tx.get_output_value()
     if total_output_value > total_input_value:
         raise ValidationError(
             f"Output value ({total_output_value}) exceeds input value ({total_input_value})"
@@ -375,6 +412,55 @@ def validate_transaction(
 # Signature validation
 # ---------------------------------------------------------------------------
 
+def validate_transaction_signatures(tx: "Transaction", utxo_set: "UTXOSet") -> bool:
+    """
+    Validate the signatures of every input of a transaction.
+
+    Errors other than an invalid signature are logged and ignored
+    (graceful degradation, as in ``validate_transaction_signature``).
+
+    Args:
+        tx: The transaction to check.
+        utxo_set: A UTXO set containing at least the outputs *tx* spends.
+
+    Returns:
+        True if all signatures are valid.
+
+    Raises:
+        ValidationError: If any input carries an invalid signature.
+    """
+    return _validate_spent_signatures(
+        tx,
+        [utxo_set.get_utxo(inp.previous_txid, inp.previous_output_index) for inp in tx.inputs],
+    )
+
+
+def _validate_spent_signatures(tx: "Transaction", spent: list) -> bool:
+    """
+    Validate every input signature of *tx* against its spent outputs.
+
+    Args:
+        tx: The transaction to check.
+        spent: The UTXOEntry spent by each input (None if missing), in
+            input order.
+
+    Returns:
+        True if all signatures are valid.
+
+    Raises:
+        ValidationError: If any input carries an invalid signature.
+    """
+    for i, utxo in enumerate(spent):
+        try:
+            if not _verify_input_signature(tx, i, utxo):
+                raise ValidationError(f"Invalid signature for input {i}")
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.warning("Signature validation error for input %d: %s", i, e)
+    return True
+
+
 def validate_transaction_signature(
     tx: "Transaction",
     input_index: int,
@@ -404,13 +490,31 @@ def validate_transaction_signature(
         True if the signature is valid (or if crypto modules are unavailable,
         in which case we log a warning and return True for graceful degradation).
     """
+    # Get the UTXO being spent
+    inp = tx.inputs[input_index]
+    utxo = utxo_set.get_utxo(inp.previous_txid, inp.previous_output_index)
+    return _verify_input_signature(tx, input_index, utxo)
+
+
+def _verify_input_signature(tx: "Transaction", input_index: int, utxo) -> bool:
+    """
+    Check one input's signature, given the output it spends.
+
+    The body of ``validate_transaction_signature``, split out so callers
+    holding a snapshot of the spent outputs need no UTXO set.
+
+    Args:
+        tx: The transaction containing the input.
+        input_index: Index of the input whose signature to verify.
+        utxo: The UTXOEntry the input spends, or None if it is missing.
+
+    Returns:
+        Same as ``validate_transaction_signature``.
+    """
     from src.crypto.keys import PublicKey, verify_transaction_input
 
     try:
         inp = tx.inputs[input_index]
-
-        # Get the UTXO being spent
-        utxo = utxo_set.get_utxo(inp.previous_txid, inp.previous_output_index)
         if utxo is None:
             return False
 
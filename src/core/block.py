@@ -18,20 +18,52 @@ appears to have leading zeros when the block meets its difficulty target).
 
 from __future__ import annotations
 
+import struct
+from functools import lru_cache
 from typing import Optional
 
-from src.crypto.hash import double_sha256
-from src.utils.encoding import (
-    bytes_to_hex,
-    hex_to_bytes,
-    int_to_little_endian,
-    little_endian_to_int,
-    encode_varint,
-    decode_varint,
-)
+from src.crypto.hash import double_sha256, sha256_hasher
+from src.crypto.merkle import merkle_root_bytes
+from src.utils.encoding import encode_varint, decode_varint
 from src.core.transaction import Transaction
 
 
+# Wire layout of the 80-byte header: version, previous block hash, Merkle
+# root, timestamp, difficulty bits, nonce (integers little-endian, hashes in
+# internal byte order).
+_HEADER_STRUCT = struct.Struct('<I32s32sIII')
+
+
+@lru_cache(maxsize=64)
+def _target_from_bits(bits: int) -> int:
+    """
+    Expand compact difficulty bits to the full target (see ``get_target``).
+
+    A chain only ever uses a handful of distinct ``difficulty_bits`` values,
+    so the expansion is cached.
+    """
+    # Sign bit set means a negative target, which no hash can meet
+    if bits & 0x00800000:
+        return 0
+    exponent = (bits >> 24) & 0xff
+    coefficient = bits & 0x007fffff
+    if exponent > 3:
+        return coefficient << (8 * (exponent - 3))
+    return coefficient >> (8 * (3 - exponent))
+
+
+@lru_cache(maxsize=64)
+def _target_bytes(bits: int) -> bytes:
+    """
+    Return the target for *bits* as 32 big-endian bytes.
+
+    Targets of 2^256 or more are clamped to all ``ff`` bytes, which every
+    hash meets anyway. Comparing equal-length big-endian byte strings is the
+    same as comparing the integers they encode.
+    """
+    return min(_target_from_bits(bits), (1 << 256) - 1).to_bytes(32, 'big')
+
+
 # ---------------------------------------------------------------------------
 # BlockHeader
 # ---------------------------------------------------------------------------
@@ -61,6 +93,21 @@ class BlockHeader:
         nonce: Mining nonce.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, which matters when
+    # an indexer keeps every header of a long chain in memory.
+    __slots__ = (
+        'version',
+        '_previous_block_hash',
+        '_prev_hash_be',
+        '_merkle_root',
+        '_merkle_root_be',
+        'timestamp',
+        'difficulty_bits',
+        'nonce',
+        '_hash_bytes',
+        '_hash_hex',
+    )
+
     def __init__(
         self,
         version: int = 1,
@@ -82,12 +129,63 @@ class BlockHeader:
             nonce: Mining nonce (default 0).
         """
         self.version = version
-        self.previous_block_hash = previous_block_hash
-        self.merkle_root = merkle_root
+        self._previous_block_hash: Optional[str] = previous_block_hash
+        self._prev_hash_be: Optional[bytes] = None
+        self._merkle_root: Optional[str] = merkle_root
+        self._merkle_root_be: Optional[bytes] = None
         self.timestamp = timestamp
         self.difficulty_bits = difficulty_bits
         self.nonce = nonce
-        self._hash: Optional[str] = None
+        self._hash_bytes: Optional[bytes] = None
+        self._hash_hex: Optional[str] = None
+
+    @property
+    def previous_block_hash(self) -> str:
+        """
+        Hex-encoded hash of the previous block (display order).
+
+        Headers parsed from the wire keep only the raw 32 bytes; the hex form
+        is derived on first access.
+        """
+        if self._previous_block_hash is None:
+            self._previous_block_hash = self._prev_hash_be[::-1].hex()
+        return self._previous_block_hash
+
+    @previous_block_hash.setter
+    def previous_block_hash(self, value: str):
+        """Set the previous block hash from a display-order hex string."""
+        self._previous_block_hash = value
+        self._prev_hash_be = None
+
+    @property
+    def merkle_root(self) -> str:
+        """
+        Hex-encoded Merkle root (display order).
+
+        Like ``previous_block_hash``, derived lazily from the raw bytes for
+        deserialized headers.
+        """
+        if self._merkle_root is None:
+            self._merkle_root = self._merkle_root_be[::-1].hex()
+        return self._merkle_root
+
+    @merkle_root.setter
+    def merkle_root(self, value: str):
+        """Set the Merkle root from a display-order hex string."""
+        self._merkle_root = value
+        self._merkle_root_be = None
+
+    @property
+    def hash_bytes(self) -> bytes:
+        """
+        The block hash as 32 raw bytes in display (big-endian) order.
+
+        This is the form used internally for proof-of-work checks, equality
+        and hashing; the hex ``hash`` is only built for display.
+        """
+        if self._hash_bytes is None:
+            self._hash_bytes = self.calculate_hash_bytes()
+        return self._hash_bytes
 
     @property
     def hash(self) -> str:
@@ -99,12 +197,57 @@ class BlockHeader:
         A valid block's hash will have leading zeros when the nonce satisfies
         the proof-of-work difficulty target.
 
+        The value is cached after the first access; set ``_hash = None``
+        after mutating a header field.
+
         Returns:
             64-character lowercase hex string.
         """
-        if self._hash is None:
-            self._hash = self.calculate_hash()
-        return self._hash
+        if self._hash_hex is None:
+            self._hash_hex = self.hash_bytes.hex()
+        return self._hash_hex
+
+    @property
+    def _hash(self) -> Optional[str]:
+        """The cached hex block hash, or None if it has not been computed."""
+        return self._hash_hex
+
+    @_hash.setter
+    def _hash(self, value: Optional[str]):
+        """Seed (or, with None, invalidate) the cached block hash."""
+        self._hash_hex = value
+        self._hash_bytes = None if value is None else bytes.fromhex(value)
+
+    def calculate_hash_bytes(self) -> bytes:
+        """
+        Compute the block hash from the serialized header as raw bytes.
+
+        Unlike ``hash`` this always recomputes, which is what the mining loop
+        needs after bumping the nonce.
+
+        Returns:
+            32 bytes in display (big-endian) order.
+        """
+        return double_sha256(self.serialize())[::-1]
+
+    def hash_midstate(self) -> tuple:
+        """
+        Pre-hash the nonce-independent part of the header for mining.
+
+        SHA-256 consumes 64-byte blocks, and the first 64 bytes of the
+        80-byte header (version, previous hash and most of the Merkle root)
+        do not change while the nonce is searched. Hashing them once and
+        copying the resulting state per attempt saves one of the three
+        compression rounds a double SHA-256 of the header costs.
+
+        Returns:
+            A tuple of (sha256 object fed with bytes 0-63, bytes 64-75).
+            For a given nonce, update a ``copy()`` of the state with the
+            tail plus the 4-byte little-endian nonce, then SHA-256 the
+            digest once more.
+        """
+        serialized = self.serialize()
+        return sha256_hasher(serialized[:64]), serialized[64:76]
 
     def calculate_hash(self) -> str:
         """
@@ -113,10 +256,7 @@ class BlockHeader:
         Returns:
             64-character lowercase hex string (reversed byte order).
         """
-        serialized = self.serialize()
-        hash_bytes = double_sha256(serialized)
-        # Reverse byte order for display (Bitcoin convention)
-        return bytes_to_hex(hash_bytes[::-1])
+        return self.calculate_hash_bytes().hex()
 
     def serialize(self) -> bytes:
         """
@@ -133,14 +273,21 @@ class BlockHeader:
         Returns:
             Exactly 80 bytes.
         """
-        result = int_to_little_endian(self.version, 4)
         # Hash fields are stored in internal byte order (reversed from display)
-        result += hex_to_bytes(self.previous_block_hash)[::-1]
-        result += hex_to_bytes(self.merkle_root)[::-1]
-        result += int_to_little_endian(self.timestamp, 4)
-        result += int_to_little_endian(self.difficulty_bits, 4)
-        result += int_to_little_endian(self.nonce, 4)
-        return result
+        prev_hash = self._prev_hash_be
+        if prev_hash is None:
+            prev_hash = self._prev_hash_be = bytes.fromhex(self._previous_block_hash)[::-1]
+        merkle_root = self._merkle_root_be
+        if merkle_root is None:
+            merkle_root = self._merkle_root_be = bytes.fromhex(self._merkle_root)[::-1]
+        return _HEADER_STRUCT.pack(
+            self.version,
+            prev_hash,
+            merkle_root,
+            self.timestamp,
+            self.difficulty_bits,
+            self.nonce,
+        )
 
     @classmethod
     def deserialize(cls, data: bytes, offset: int = 0) -> tuple:
@@ -163,35 +310,24 @@ class BlockHeader:
                 f"need 80 bytes, have {len(data) - offset}"
             )
 
-        start = offset
-
-        version = little_endian_to_int(data[offset:offset + 4])
-        offset += 4
-
-        # Reverse from internal byte order to display order
-        previous_block_hash = bytes_to_hex(data[offset:offset + 32][::-1])
-        offset += 32
-
-        merkle_root = bytes_to_hex(data[offset:offset + 32][::-1])
-        offset += 32
-
-        timestamp = little_endian_to_int(data[offset:offset + 4])
-        offset += 4
-
-        difficulty_bits = little_endian_to_int(data[offset:offset + 4])
-        offset += 4
-
-        nonce = little_endian_to_int(data[offset:offset + 4])
-        offset += 4
+        version, prev_hash, merkle_root, timestamp, difficulty_bits, nonce = (
+            _HEADER_STRUCT.unpack_from(data, offset)
+        )
 
-        return (cls(
-            version=version,
-            previous_block_hash=previous_block_hash,
-            merkle_root=merkle_root,
-            timestamp=timestamp,
-            difficulty_bits=difficulty_bits,
-            nonce=nonce,
-        ), offset - start)
+        # Keep the hash fields in internal byte order; the display-order hex
+        # strings are only built if someone reads them.
+        header = cls.__new__(cls)
+        header.version = version
+        header._previous_block_hash = None
+        header._prev_hash_be = prev_hash
+        header._merkle_root = None
+        header._merkle_root_be = merkle_root
+        header.timestamp = timestamp
+        header.difficulty_bits = difficulty_bits
+        header.nonce = nonce
+        header._hash_bytes = None
+        header._hash_hex = None
+        return (header, _HEADER_STRUCT.size)
 
     def get_target(self) -> int:
         """
@@ -210,22 +346,7 @@ class BlockHeader:
         Returns:
             The 256-bit target as a Python integer.
         """
-        # Extract the exponent (number of bytes) and coefficient
-        exponent = (self.difficulty_bits >> 24) & 0xff
-        coefficient = self.difficulty_bits & 0x007fffff
-
-        # Handle the sign bit (bit 23 of coefficient) -- in Bitcoin,
-        # if set, the target is negative, which we treat as zero
-        if self.difficulty_bits & 0x00800000:
-            coefficient = -coefficient
-
-        if exponent <= 3:
-            target = coefficient >> (8 * (3 - exponent))
-        else:
-            target = coefficient << (8 * (exponent - 3))
-
-        # Target cannot be negative or exceed 2^256
-        return max(0, target)
+        return _target_from_bits(self.difficulty_bits)
 
     def meets_difficulty_target(self) -> bool:
         """
@@ -237,11 +358,9 @@ class BlockHeader:
         Returns:
             True if the block hash meets the difficulty requirement.
         """
-        target = self.get_target()
-        # Convert the block hash to an integer for comparison
-        # The hash is in display order (big-endian), so interpret directly
-        block_hash_int = int(self.hash, 16)
-        return block_hash_int <= target
+        # The raw hash bytes are in display order (big-endian), so they can
+        # be compared against the big-endian target bytes directly
+        return self.hash_bytes <= _target_bytes(self.difficulty_bits)
 
     def to_dict(self) -> dict:
         """
@@ -293,10 +412,10 @@ class BlockHeader:
     def __eq__(self, other) -> bool:
         if not isinstance(other, BlockHeader):
             return NotImplemented
-        return self.hash == other.hash
+        return self.hash_bytes == other.hash_bytes
 
     def __hash__(self) -> int:
-        return hash(self.hash)
+        return hash(self.hash_bytes)
 
 
 # ---------------------------------------------------------------------------
@@ -318,8 +437,14 @@ class Block:
     Attributes:
         header: The block's 80-byte header.
         transactions: List of transactions included in the block.
+
+    The header's Merkle root is refreshed lazily: ``add_transaction`` (or
+    assigning a new ``transactions`` list) only marks it stale, and the root
+    is recomputed once the next time ``header`` is read.
     """
 
+    __slots__ = ('_header', '_transactions', '_height', '_merkle_dirty')
+
     def __init__(
         self,
         header: Optional[BlockHeader] = None,
@@ -332,9 +457,40 @@ class Block:
             header: A BlockHeader instance (creates a default if None).
             transactions: List of Transaction instances (default empty).
         """
-        self.header = header if header is not None else BlockHeader()
-        self.transactions = transactions if transactions is not None else []
+        self._header = header if header is not None else BlockHeader()
+        self._transactions = transactions if transactions is not None else []
         self._height: Optional[int] = None
+        self._merkle_dirty = False
+
+    @property
+    def header(self) -> BlockHeader:
+        """
+        The block header, with its Merkle root brought up to date.
+
+        If transactions were added since the root was last computed, the
+        root is rebuilt here (once) and the cached block hash invalidated.
+        """
+        if self._merkle_dirty:
+            self._merkle_dirty = False
+            self._header.merkle_root = self.calculate_merkle_root()
+            self._header._hash = None
+        return self._header
+
+    @header.setter
+    def header(self, value: BlockHeader):
+        """Replace the block header."""
+        self._header = value
+
+    @property
+    def transactions(self) -> list:
+        """List of transactions included in the block."""
+        return self._transactions
+
+    @transactions.setter
+    def transactions(self, value: list):
+        """Replace the transaction list and mark the Merkle root stale."""
+        self._transactions = value
+        self._merkle_dirty = True
 
     @property
     def height(self) -> Optional[int]:
@@ -377,46 +533,24 @@ class Block:
         if len(self.transactions) == 1:
             return self.transactions[0].txid
 
-        # Start with transaction hashes in internal byte order (reversed txid)
-        # Merkle tree operations use the raw hash bytes (internal order)
-        current_level = []
-        for tx in self.transactions:
-            # txid is in display order (reversed); convert to internal order
-            tx_hash = hex_to_bytes(tx.txid)[::-1]
-            current_level.append(tx_hash)
-
-        # Build the tree bottom-up
-        while len(current_level) > 1:
-            next_level = []
-
-            # If odd number of hashes, duplicate the last one
-            if len(current_level) % 2 != 0:
-                current_level.append(current_level[-1])
-
-            # Hash pairs together
-            for i in range(0, len(current_level), 2):
-                combined = current_level[i] + current_level[i + 1]
-                next_level.append(double_sha256(combined))
-
-            current_level = next_level
-
-        # The root is in internal byte order; reverse to display order
-        return bytes_to_hex(current_level[0][::-1])
+        # Merkle tree operations use the raw hash bytes in internal order
+        # (the reversed txid); the root is reversed back for display
+        leaves = Transaction.txid_bytes_batch(self.transactions)
+        return merkle_root_bytes(leaves)[::-1].hex()
 
     def add_transaction(self, tx: Transaction):
         """
         Append a transaction to this block.
 
-        Invalidates the cached Merkle root and block hash since the
-        transaction set has changed.
+        The Merkle root and block hash are not recomputed here; they are
+        marked stale and rebuilt the next time ``header`` is accessed, so a
+        run of appends costs a single Merkle rebuild.
 
         Args:
             tx: The Transaction to add.
         """
-        self.transactions.append(tx)
-        # Invalidate cached values
-        self.header.merkle_root = self.calculate_merkle_root()
-        self.header._hash = None
+        self._transactions.append(tx)
+        self._merkle_dirty = True
 
     def get_size(self) -> int:
         """
@@ -430,9 +564,7 @@ class Block:
         """
         size = 80  # Header is always 80 bytes
         size += len(encode_varint(len(self.transactions)))
-        for tx in self.transactions:
-            size += len(tx.serialize())
-        return size
+        return size + sum(tx.get_size() for tx in self.transactions)
 
     def get_coinbase(self) -> Optional[Transaction]:
         """
@@ -495,7 +627,7 @@ class Block:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Block):
             return NotImplemented
-        return self.header.hash == other.header.hash
+        return self.header.hash_bytes == other.header.hash_bytes
 
     def __hash__(self) -> int:
-        return hash(self.header.hash)
+        return hash(self.header.hash_bytes)
@@ -33,9 +33,14 @@ and local blockchain simulation.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import threading
 from typing import TYPE_CHECKING
 
+from sortedcontainers import SortedList
+
 if TYPE_CHECKING:
     from src.core.transaction import Transaction
     from src.core.utxo import UTXOSet
@@ -44,6 +49,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _synchronized(method):
+    """Run a Mempool method while holding the pool's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Mempool:
     """
     Transaction memory pool -- a staging area for unconfirmed transactions.
@@ -54,16 +68,39 @@ class Mempool:
 
     Attributes:
         transactions: Mapping from txid (hex string) to Transaction objects.
-        _fee_index: List of (fee_rate, txid) tuples kept in descending
-            fee-rate order for efficient retrieval of highest-fee transactions.
+        _fee_index: Sorted list of ``(-fee_rate, seq, txid)`` entries, so the
+            highest fee rate comes first and ties keep arrival order.
+            Inserts and removals are O(log n).
+        _fee_entries: Maps each mempool txid to its ``_fee_index`` entry,
+            so a removal can find the entry without scanning.
+        _spent_outpoints: Maps every ``(previous_txid, output_index)`` spent
+            by a mempool transaction to that transaction's txid.
+        _lock: Re-entrant lock held by every public method, so callers and
+            a blockchain's writer may use the pool from different threads.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty mempool."""
-        self.transactions: dict[str, Transaction] = {}
-        self._fee_index: list[tuple[float, str]] = []
+    def __init__(self, lock: "threading.RLock | None" = None) -> None:
+        """
+        Initialize an empty mempool.
 
-    def add_transaction(self, tx: "Transaction", utxo_set: "UTXOSet | None" = None) -> bool:
+        Args:
+            lock: Lock to guard the pool with, e.g. one shared with the
+                owning blockchain. A private lock is created if omitted.
+        """
+        self._lock = lock if lock is not None else threading.RLock()
+        self.transactions: dict[str, Transaction] = {}
+        self._fee_index: SortedList = SortedList()
+        self._fee_entries: dict[str, tuple[float, int, str]] = {}
+        self._seq = itertools.count()
+        self._spent_outpoints: dict[tuple[str, int], str] = {}
+
+    @_synchronized
+    def add_transaction(
+        self,
+        tx: "Transaction",
+        utxo_set: "UTXOSet | None" = None,
+        fee_rate: float | None = None,
+    ) -> bool:
         """
         Attempt to add a transaction to the mempool.
 
@@ -81,6 +118,10 @@ class Mempool:
             tx: The transaction to add.
             utxo_set: Optional UTXO set used to calculate the fee rate.
                       If not provided, the fee rate defaults to 0.
+            fee_rate: Precomputed fee rate in satoshis per byte, e.g. from
+                      a caller that already looked up the input values
+                      during validation. When given, ``utxo_set`` is not
+                      consulted.
 
         Returns:
             True if the transaction was accepted, False otherwise.
@@ -102,19 +143,22 @@ class Mempool:
             logger.warning("Rejecting double-spend transaction %s", txid[:16])
             return False
 
-        # Calculate fee rate for prioritization
-        fee_rate = self._calculate_fee_rate(tx, utxo_set)
+        # Calculate fee rate for prioritization (only once the cheap checks
+        # above have passed)
+        if fee_rate is None:
+            fee_rate = self._calculate_fee_rate(tx, utxo_set)
 
         # Add to the pool
         self.transactions[txid] = tx
+        self._index_inputs(tx, txid)
 
-        # Insert into the fee index maintaining descending order
-        self._fee_index.append((fee_rate, txid))
-        self._fee_index.sort(key=lambda entry: entry[0], reverse=True)
+        # Insert into the fee index
+        self._push_fee_entry(txid, fee_rate)
 
         logger.info("Added transaction %s to mempool (fee_rate=%.2f sat/byte)", txid[:16], fee_rate)
         return True
 
+    @_synchronized
     def remove_transaction(self, txid: str) -> "Transaction | None":
         """
         Remove a transaction from the mempool by its txid.
@@ -127,10 +171,12 @@ class Mempool:
         """
         tx = self.transactions.pop(txid, None)
         if tx is not None:
-            self._fee_index = [(rate, tid) for rate, tid in self._fee_index if tid != txid]
+            self._forget_fee_entry(txid)
+            self._unindex_inputs(tx)
             logger.debug("Removed transaction %s from mempool", txid[:16])
         return tx
 
+    @_synchronized
     def get_transactions(self, limit: int | None = None) -> list["Transaction"]:
         """
         Retrieve transactions ordered by fee rate (highest first).
@@ -145,11 +191,35 @@ class Mempool:
         Returns:
             List of Transaction objects sorted by descending fee rate.
         """
-        ordered_txids = [txid for _, txid in self._fee_index]
-        if limit is not None:
-            ordered_txids = ordered_txids[:limit]
-        return [self.transactions[txid] for txid in ordered_txids if txid in self.transactions]
+        transactions = self.transactions
+        return [transactions[txid] for _, _, txid in itertools.islice(self._fee_index, limit)]
+
+    @_synchronized
+    def get_fee_rate(self, txid: str) -> "float | None":
+        """
+        Look up the fee rate recorded for a mempool transaction.
 
+        Args:
+            txid: The transaction ID (hex string).
+
+        Returns:
+            The fee rate in satoshis per byte, or None if *txid* is not in
+            the mempool.
+        """
+        entry = self._fee_entries.get(txid)
+        return None if entry is None else -entry[0]
+
+    @_synchronized
+    def get_fee_rates(self) -> list[tuple[float, str]]:
+        """
+        List ``(fee_rate, txid)`` for every mempool transaction.
+
+        Returns:
+            Pairs in descending fee-rate order (ties in arrival order).
+        """
+        return [(-neg_rate, txid) for neg_rate, _, txid in self._fee_index]
+
+    @_synchronized
     def get_transaction(self, txid: str) -> "Transaction | None":
         """
         Look up a single transaction by txid.
@@ -162,6 +232,7 @@ class Mempool:
         """
         return self.transactions.get(txid)
 
+    @_synchronized
     def clear_confirmed(self, block: "Block") -> int:
         """
         Remove all transactions that were confirmed in a block.
@@ -176,15 +247,79 @@ class Mempool:
         Returns:
             The number of transactions removed from the mempool.
         """
-        removed_count = 0
-        for tx in block.transactions:
-            if tx.is_coinbase():
-                continue
-            if self.remove_transaction(tx.txid) is not None:
-                removed_count += 1
-        logger.info("Cleared %d confirmed transactions from mempool", removed_count)
-        return removed_count
+        return self.clear_confirmed_ids(
+            {tx.txid for tx in block.transactions if not tx.is_coinbase()}
+        )
 
+    @_synchronized
+    def clear_confirmed_ids(self, txids: set[str]) -> int:
+        """
+        Remove every mempool transaction whose txid is in *txids*.
+
+        Only the txids actually in the pool (a set intersection) are
+        touched.
+
+        Args:
+            txids: Transaction IDs confirmed by one or more blocks.
+
+        Returns:
+            The number of transactions removed from the mempool.
+        """
+        transactions = self.transactions
+        hit = txids & transactions.keys()
+        for txid in hit:
+            self._unindex_inputs(transactions.pop(txid))
+            self._forget_fee_entry(txid)
+        logger.info("Cleared %d confirmed transactions from mempool", len(hit))
+        return len(hit)
+
+    @_synchronized
+    def add_transactions_batch(
+        self, txs: list["Transaction"], utxo_set: "UTXOSet | None" = None
+    ) -> int:
+        """
+        Add several transactions, applying the same rules as ``add_transaction``.
+
+        Used when a reorg returns a batch of transactions to the pool: the
+        checks are inlined and the per-transaction log line is skipped.
+
+        Args:
+            txs: Transactions to add, in first-seen order.
+            utxo_set: Optional UTXO set used to calculate fee rates.
+
+        Returns:
+            The number of transactions accepted.
+        """
+        accepted = 0
+        for tx in txs:
+            txid = tx.txid
+            if txid in self.transactions or tx.is_coinbase():
+                continue
+            if self.is_double_spend(tx):
+                logger.warning("Rejecting double-spend transaction %s", txid[:16])
+                continue
+            self.transactions[txid] = tx
+            self._index_inputs(tx, txid)
+            self._push_fee_entry(txid, self._calculate_fee_rate(tx, utxo_set))
+            accepted += 1
+        logger.info("Added %d transactions to mempool in batch", accepted)
+        return accepted
+
+    # ------------------------------------------------------------------
+    # Fee index
+    # ------------------------------------------------------------------
+
+    def _push_fee_entry(self, txid: str, fee_rate: float) -> None:
+        """Record *txid*'s fee rate in the fee index in O(log n)."""
+        entry = (-fee_rate, next(self._seq), txid)
+        self._fee_entries[txid] = entry
+        self._fee_index.add(entry)
+
+    def _forget_fee_entry(self, txid: str) -> None:
+        """Remove *txid*'s entry from the fee index in O(log n)."""
+        self._fee_index.remove(self._fee_entries.pop(txid))
+
+    @_synchronized
     def is_double_spend(self, tx: "Transaction") -> bool:
         """
         Check whether any input in *tx* spends the same UTXO as an existing
@@ -200,20 +335,24 @@ class Mempool:
         Returns:
             True if a double-spend conflict is detected, False otherwise.
         """
-        # Build a set of (prev_txid, prev_output_index) for all inputs in the
-        # existing mempool transactions.
-        spent_outputs: set[tuple[str, int]] = set()
-        for existing_tx in self.transactions.values():
-            for inp in existing_tx.inputs:
-                if not inp.is_coinbase():
-                    spent_outputs.add((inp.previous_txid, inp.previous_output_index))
-
-        # Check if any input in the candidate tx conflicts
+        spent = self._spent_outpoints
+        return any(
+            (inp.previous_txid, inp.previous_output_index) in spent
+            for inp in tx.inputs
+            if not inp.is_coinbase()
+        )
+
+    def _index_inputs(self, tx: "Transaction", txid: str) -> None:
+        """Record the outpoints spent by an accepted transaction."""
         for inp in tx.inputs:
             if not inp.is_coinbase():
-                if (inp.previous_txid, inp.previous_output_index) in spent_outputs:
-                    return True
-        return False
+                self._spent_outpoints[(inp.previous_txid, inp.previous_output_index)] = txid
+
+    def _unindex_inputs(self, tx: "Transaction") -> None:
+        """Forget the outpoints spent by a removed transaction."""
+        for inp in tx.inputs:
+            if not inp.is_coinbase():
+                self._spent_outpoints.pop((inp.previous_txid, inp.previous_output_index), None)
 
     @property
     def size(self) -> int:
@@ -241,21 +380,21 @@ class Mempool:
             return 0.0
 
         try:
-            total_input_value = 0
-            for inp in tx.inputs:
-                if inp.is_coinbase():
-                    return 0.0
-                utxo = utxo_set.get_utxo(inp.previous_txid, inp.previous_output_index)
-                if utxo is None:
-                    return 0.0
-                total_input_value += utxo.value
-
-            total_output_value = sum(out.value for out in tx.outputs)
+            if any(inp.is_coinbase() for inp in tx.inputs):
+                return 0.0
+            utxos = utxo_set.get_many(
+                (inp.previous_txid, inp.previous_output_index) for inp in tx.inputs
+            )
+            if any(utxo is None for utxo in utxos):
+                return 0.0
+            total_input_value = sum(utxo.value for utxo in utxos)
+
+            total_output_value = tx.get_output_value()
             fee = total_input_value - total_output_value
             if fee < 0:
                 return 0.0
 
-            tx_size = len(tx.serialize())
+            tx_size = tx.get_size()
             if tx_size == 0:
                 return 0.0
 
@@ -263,6 +402,7 @@ class Mempool:
         except Exception:
             return 0.0
 
+    @_synchronized
     def to_dict(self) -> dict:
         """
         Serialize the mempool state to a JSON-compatible dictionary.
@@ -272,7 +412,7 @@ class Mempool:
         """
         return {
             "transactions": {txid: tx.to_dict() for txid, tx in self.transactions.items()},
-            "fee_index": self._fee_index,
+            "fee_index": self.get_fee_rates(),
         }
 
     def __repr__(self) -> str:
@@ -21,19 +21,61 @@ integers and variable-length integer prefixes for lists and byte arrays.
 
 from __future__ import annotations
 
+import struct
+from functools import lru_cache
 from typing import Optional
 
-from src.crypto.hash import double_sha256
+from src.crypto.hash import double_sha256, double_sha256_many
 from src.utils.encoding import (
-    bytes_to_hex,
-    hex_to_bytes,
-    int_to_little_endian,
-    little_endian_to_int,
     encode_varint,
     decode_varint,
+    varint_size,
     base58check_encode,
 )
 
+# Precompiled little-endian integer codecs for the fixed-width fields
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+# The null outpoint referenced by coinbase inputs
+_COINBASE_TXID_HEX = "0" * 64
+_COINBASE_TXID_BYTES = bytes(32)
+_COINBASE_OUTPUT_INDEX = 0xffffffff
+
+# Fixed parts of a serialized coinbase transaction, around its variable
+# fields (the input script, the reward value and the output script):
+#   version=1 | 1 input | null outpoint | <script> | sequence | 1 output
+#   | <value> <pubkey_script> | locktime=0
+_COINBASE_HEAD = (
+    _U32.pack(1) + b'\x01' + _COINBASE_TXID_BYTES + _U32.pack(_COINBASE_OUTPUT_INDEX)
+)
+_COINBASE_MID = _U32.pack(0xffffffff) + b'\x01'
+_COINBASE_TAIL = _U32.pack(0)
+
+
+def _join_coinbase(script: bytes, reward_amount: int, pubkey_script: bytes) -> bytes:
+    """Serialize a coinbase from its variable fields and the fixed template."""
+    return b''.join((
+        _COINBASE_HEAD,
+        encode_varint(len(script)), script,
+        _COINBASE_MID,
+        _U64.pack(reward_amount),
+        encode_varint(len(pubkey_script)), pubkey_script,
+        _COINBASE_TAIL,
+    ))
+
+
+@lru_cache(maxsize=65536)
+def _p2pkh_address(pubkey_hash: bytes) -> str:
+    """
+    Base58Check-encode a public key hash as a mainnet P2PKH address.
+
+    Many outputs pay the same few addresses (miners, change, busy wallets)
+    and the encoding costs two SHA-256s plus a base58 division loop, so the
+    results are cached.
+    """
+    return base58check_encode(b'\x00', pubkey_hash)
+
 
 # ---------------------------------------------------------------------------
 # TransactionOutput
@@ -52,18 +94,50 @@ class TransactionOutput:
         pubkey_script: Hex-encoded locking script / public key hash.
     """
 
-    def __init__(self, value: int, pubkey_script: str):
+    # Fixed attribute layout: no per-instance __dict__. Blocks, the mempool
+    # and chain imports create these in bulk, so this saves memory and
+    # speeds up construction.
+    __slots__ = ('value', '_pubkey_script', '_pubkey_script_raw')
+
+    def __init__(self, value: int, pubkey_script: str | bytes):
         """
         Initialize a transaction output.
 
         Args:
             value: Amount in satoshis.
-            pubkey_script: Hex-encoded locking script.
+            pubkey_script: Locking script, as hex or raw bytes.
         """
         self.value = value
         self.pubkey_script = pubkey_script
 
-    def serialize(self) -> bytes:
+    @property
+    def pubkey_script(self) -> str:
+        """
+        Hex-encoded locking script.
+
+        Outputs parsed from the wire keep the raw script bytes; the hex form
+        is derived on first access.
+        """
+        if self._pubkey_script is None:
+            self._pubkey_script = self._pubkey_script_raw.hex()
+        return self._pubkey_script
+
+    @pubkey_script.setter
+    def pubkey_script(self, value: str | bytes):
+        """Set the locking script from a hex string or raw bytes."""
+        if isinstance(value, str):
+            self._pubkey_script, self._pubkey_script_raw = value, None
+        else:
+            self._pubkey_script, self._pubkey_script_raw = None, bytes(value)
+
+    @property
+    def pubkey_script_bytes(self) -> bytes:
+        """The raw locking script bytes, decoded from hex on first access."""
+        if self._pubkey_script_raw is None:
+            self._pubkey_script_raw = bytes.fromhex(self._pubkey_script)
+        return self._pubkey_script_raw
+
+    def serialize(self, out: Optional[bytearray] = None) -> bytes:
         """
         Serialize this output to binary format.
 
@@ -72,14 +146,25 @@ class TransactionOutput:
             - script_length: varint
             - pubkey_script: raw bytes
 
+        Args:
+            out: Optional buffer to append the serialized output to, so a
+                 whole transaction can be built in one allocation.
+
         Returns:
-            Serialized bytes.
+            Serialized bytes, or *out* itself when a buffer was given.
         """
-        result = int_to_little_endian(self.value, 8)
-        script_bytes = hex_to_bytes(self.pubkey_script)
-        result += encode_varint(len(script_bytes))
+        script_bytes = self.pubkey_script_bytes
+        result = bytearray() if out is None else out
+        result += _U64.pack(self.value)
+        # Lengths below 0xfd are a one-byte varint; append it directly and
+        # only call encode_varint for larger values
+        n = len(script_bytes)
+        if n < 0xfd:
+            result.append(n)
+        else:
+            result += encode_varint(n)
         result += script_bytes
-        return result
+        return bytes(result) if out is None else result
 
     @classmethod
     def deserialize(cls, data: bytes, offset: int = 0) -> tuple:
@@ -95,17 +180,41 @@ class TransactionOutput:
         """
         start = offset
 
-        value = little_endian_to_int(data[offset:offset + 8])
+        value = _U64.unpack_from(data, offset)[0]
         offset += 8
 
-        script_length, varint_size = decode_varint(data, offset)
-        offset += varint_size
+        # One-byte varints (lengths below 0xfd) are read inline; longer
+        # encodings go through decode_varint
+        script_length = data[offset]
+        if script_length < 0xfd:
+            offset += 1
+        else:
+            script_length, consumed = decode_varint(data, offset)
+            offset += consumed
 
-        script_bytes = data[offset:offset + script_length]
-        pubkey_script = bytes_to_hex(script_bytes)
+        # Fill the slots directly rather than going through __init__ and the
+        # property setter. The script is kept as raw bytes; hex is only
+        # derived if pubkey_script is read.
+        txout = cls.__new__(cls)
+        txout.value = value
+        txout._pubkey_script = None
+        txout._pubkey_script_raw = bytes(data[offset:offset + script_length])
         offset += script_length
 
-        return (cls(value=value, pubkey_script=pubkey_script), offset - start)
+        return (txout, offset - start)
+
+    def get_size(self) -> int:
+        """
+        Return the serialized size of this output without serializing it.
+
+        Returns:
+            Size in bytes: 8 (value) + varint(script length) + script.
+        """
+        if self._pubkey_script_raw is not None:
+            script_length = len(self._pubkey_script_raw)
+        else:
+            script_length = len(self._pubkey_script) // 2
+        return 8 + varint_size(script_length) + script_length
 
     def is_dust(self, threshold: int = 546) -> bool:
         """
@@ -134,8 +243,7 @@ class TransactionOutput:
         Returns:
             A Base58Check-encoded Bitcoin address string.
         """
-        pubkey_hash = hex_to_bytes(self.pubkey_script)
-        return base58check_encode(b'\x00', pubkey_hash)
+        return _p2pkh_address(self.pubkey_script_bytes)
 
     def to_dict(self) -> dict:
         """
@@ -193,11 +301,20 @@ class TransactionInput:
         sequence: Sequence number (default 0xffffffff for final).
     """
 
+    __slots__ = (
+        '_previous_txid',
+        '_previous_txid_le',
+        'previous_output_index',
+        '_signature_script',
+        '_signature_script_raw',
+        'sequence',
+    )
+
     def __init__(
         self,
         previous_txid: str,
         previous_output_index: int,
-        signature_script: str = "",
+        signature_script: str | bytes = "",
         sequence: int = 0xffffffff,
     ):
         """
@@ -206,15 +323,62 @@ class TransactionInput:
         Args:
             previous_txid: Hex string of the transaction ID being spent.
             previous_output_index: Output index within that transaction.
-            signature_script: Hex-encoded unlocking script (default empty).
+            signature_script: Unlocking script, as hex or raw bytes
+                (default empty).
             sequence: Sequence number (default 0xffffffff).
         """
-        self.previous_txid = previous_txid
+        self._previous_txid: Optional[str] = previous_txid
+        self._previous_txid_le: Optional[bytes] = None
         self.previous_output_index = previous_output_index
         self.signature_script = signature_script
         self.sequence = sequence
 
-    def serialize(self) -> bytes:
+    @property
+    def previous_txid(self) -> str:
+        """
+        Hex-encoded ID of the transaction being spent (display order).
+
+        Inputs parsed from the wire keep the raw 32 bytes in internal order;
+        the hex form is derived on first access.
+        """
+        if self._previous_txid is None:
+            self._previous_txid = self._previous_txid_le[::-1].hex()
+        return self._previous_txid
+
+    @previous_txid.setter
+    def previous_txid(self, value: str):
+        """Set the previous txid from a display-order hex string."""
+        self._previous_txid = value
+        self._previous_txid_le = None
+
+    @property
+    def signature_script(self) -> str:
+        """
+        Hex-encoded unlocking script.
+
+        Inputs parsed from the wire keep the raw script bytes; the hex form
+        is derived on first access.
+        """
+        if self._signature_script is None:
+            self._signature_script = self._signature_script_raw.hex()
+        return self._signature_script
+
+    @signature_script.setter
+    def signature_script(self, value: str | bytes):
+        """Set the unlocking script from a hex string or raw bytes."""
+        if isinstance(value, str):
+            self._signature_script, self._signature_script_raw = value, None
+        else:
+            self._signature_script, self._signature_script_raw = None, bytes(value)
+
+    @property
+    def signature_script_bytes(self) -> bytes:
+        """The raw unlocking script bytes, decoded from hex on first access."""
+        if self._signature_script_raw is None:
+            self._signature_script_raw = bytes.fromhex(self._signature_script)
+        return self._signature_script_raw
+
+    def serialize(self, out: Optional[bytearray] = None) -> bytes:
         """
         Serialize this input to binary format.
 
@@ -225,22 +389,32 @@ class TransactionInput:
             - signature_script: raw bytes
             - sequence: 4 bytes, little-endian
 
+        Args:
+            out: Optional buffer to append the serialized input to, so a
+                 whole transaction can be built in one allocation.
+
         Returns:
-            Serialized bytes.
+            Serialized bytes, or *out* itself when a buffer was given.
         """
-        # txid is stored in internal byte order (reversed from display)
-        result = bytes.fromhex(self.previous_txid)[::-1]
-        result += int_to_little_endian(self.previous_output_index, 4)
-
-        if self.signature_script:
-            script_bytes = hex_to_bytes(self.signature_script)
+        # txid is serialized in internal byte order (reversed from display);
+        # keep those bytes so re-serializing skips the hex decode and reversal
+        txid_le = self._previous_txid_le
+        if txid_le is None:
+            txid_le = self._previous_txid_le = bytes.fromhex(self._previous_txid)[::-1]
+
+        script_bytes = self.signature_script_bytes
+
+        result = bytearray() if out is None else out
+        result += txid_le
+        result += _U32.pack(self.previous_output_index)
+        n = len(script_bytes)
+        if n < 0xfd:
+            result.append(n)
         else:
-            script_bytes = b''
-        result += encode_varint(len(script_bytes))
+            result += encode_varint(n)
         result += script_bytes
-
-        result += int_to_little_endian(self.sequence, 4)
-        return result
+        result += _U32.pack(self.sequence)
+        return bytes(result) if out is None else result
 
     @classmethod
     def deserialize(cls, data: bytes, offset: int = 0) -> tuple:
@@ -256,31 +430,51 @@ class TransactionInput:
         """
         start = offset
 
-        # txid is in internal (reversed) byte order
-        previous_txid = bytes_to_hex(data[offset:offset + 32][::-1])
+        # txid is in internal (reversed) byte order; it is kept as-is and
+        # only turned into display hex if previous_txid is read
+        previous_txid_le = bytes(data[offset:offset + 32])
         offset += 32
 
-        previous_output_index = little_endian_to_int(data[offset:offset + 4])
+        previous_output_index = _U32.unpack_from(data, offset)[0]
         offset += 4
 
-        script_length, varint_size = decode_varint(data, offset)
-        offset += varint_size
-
-        if script_length > 0:
-            signature_script = bytes_to_hex(data[offset:offset + script_length])
+        script_length = data[offset]
+        if script_length < 0xfd:
+            offset += 1
         else:
-            signature_script = ""
+            script_length, consumed = decode_varint(data, offset)
+            offset += consumed
+
+        signature_script = bytes(data[offset:offset + script_length])
         offset += script_length
 
-        sequence = little_endian_to_int(data[offset:offset + 4])
+        sequence = _U32.unpack_from(data, offset)[0]
         offset += 4
 
-        return (cls(
-            previous_txid=previous_txid,
-            previous_output_index=previous_output_index,
-            signature_script=signature_script,
-            sequence=sequence,
-        ), offset - start)
+        # Fill the slots directly rather than going through __init__ and the
+        # property setters; hex forms are derived only if read
+        txin = cls.__new__(cls)
+        txin._previous_txid = None
+        txin._previous_txid_le = previous_txid_le
+        txin.previous_output_index = previous_output_index
+        txin._signature_script = None
+        txin._signature_script_raw = signature_script
+        txin.sequence = sequence
+        return (txin, offset - start)
+
+    def get_size(self) -> int:
+        """
+        Return the serialized size of this input without serializing it.
+
+        Returns:
+            Size in bytes: 32 (txid) + 4 (index) + varint(script length)
+            + script + 4 (sequence).
+        """
+        if self._signature_script_raw is not None:
+            script_length = len(self._signature_script_raw)
+        else:
+            script_length = len(self._signature_script) // 2
+        return 40 + varint_size(script_length) + script_length
 
     def is_coinbase(self) -> bool:
         """
@@ -293,10 +487,14 @@ class TransactionInput:
         Returns:
             True if this is a coinbase input.
         """
-        return (
-            self.previous_txid == "0" * 64
-            and self.previous_output_index == 0xffffffff
-        )
+        # Check the index first (it rules out ordinary inputs), then compare
+        # whichever txid form is already present so parsed inputs do not
+        # build their hex txid just for this
+        if self.previous_output_index != _COINBASE_OUTPUT_INDEX:
+            return False
+        if self._previous_txid is not None:
+            return self._previous_txid == _COINBASE_TXID_HEX
+        return self._previous_txid_le == _COINBASE_TXID_BYTES
 
     def to_dict(self) -> dict:
         """
@@ -360,6 +558,11 @@ class Transaction:
         locktime: Earliest block/time when the tx can be included (default 0).
     """
 
+    __slots__ = (
+        'version', 'inputs', 'outputs', 'locktime',
+        '_txid', '_txid_bytes', '_size', '_output_value', '_serialized',
+    )
+
     def __init__(
         self,
         version: int = 1,
@@ -381,6 +584,10 @@ class Transaction:
         self.outputs = outputs if outputs is not None else []
         self.locktime = locktime
         self._txid: Optional[str] = None
+        self._txid_bytes: Optional[bytes] = None
+        self._size: Optional[int] = None
+        self._output_value: Optional[int] = None
+        self._serialized: Optional[bytes] = None
 
     @property
     def txid(self) -> str:
@@ -391,13 +598,34 @@ class Transaction:
         displayed in reversed byte order (Bitcoin convention: the hash
         is computed in natural order but displayed with bytes reversed).
 
+        The raw digest (``txid_bytes``) is the primary cache; the hex form
+        is derived from it on first access.
+
         Returns:
             64-character lowercase hex string.
         """
         if self._txid is None:
-            self._txid = self.calculate_txid()
+            self._txid = self.txid_bytes[::-1].hex()
         return self._txid
 
+    @property
+    def txid_bytes(self) -> bytes:
+        """
+        The raw 32-byte double-SHA-256 of the transaction, in internal order.
+
+        This is the form Merkle trees and equality work with; it is the
+        reverse of the bytes shown in the hex ``txid``.
+
+        Returns:
+            32-byte digest.
+        """
+        if self._txid_bytes is None:
+            if self._txid is not None:
+                self._txid_bytes = bytes.fromhex(self._txid)[::-1]
+            else:
+                self._txid_bytes = double_sha256(self.serialize())
+        return self._txid_bytes
+
     def calculate_txid(self) -> str:
         """
         Compute the transaction ID by double-hashing the serialized form.
@@ -412,9 +640,92 @@ class Transaction:
         serialized = self.serialize()
         hash_bytes = double_sha256(serialized)
         # Reverse byte order for display (Bitcoin convention)
-        return bytes_to_hex(hash_bytes[::-1])
+        return hash_bytes[::-1].hex()
 
-    def serialize(self) -> bytes:
+    @classmethod
+    def txid_bytes_batch(cls, txs: list) -> list[bytes]:
+        """
+        Return the raw txid digests of many transactions, hashing the uncached ones together.
+
+        Transactions with no memoized txid are serialized and passed to
+        ``double_sha256_many`` in one call, and the results are stored on
+        each transaction as if ``txid_bytes`` had been accessed.
+
+        Args:
+            txs: The Transaction objects.
+
+        Returns:
+            The 32-byte digests (internal order), in the order of *txs*.
+        """
+        pending = [tx for tx in txs if tx._txid_bytes is None and tx._txid is None]
+        if pending:
+            digests = double_sha256_many(tx.serialize() for tx in pending)
+            for tx, digest in zip(pending, digests):
+                tx._txid_bytes = digest
+        return [tx.txid_bytes for tx in txs]
+
+    @classmethod
+    def calculate_txids_batch(cls, txs: list) -> list[str]:
+        """
+        Return the txids of many transactions, hashing the uncached ones together.
+
+        Args:
+            txs: The Transaction objects.
+
+        Returns:
+            The txids (display-order hex strings), in the order of *txs*.
+        """
+        cls.txid_bytes_batch(txs)
+        return [tx.txid for tx in txs]
+
+    def _dirty(self) -> None:
+        """
+        Drop cached values derived from the transaction contents.
+
+        The serialized bytes, txid, size and output total are memoized on
+        first use, so code that mutates ``inputs``/``outputs`` (or their
+        fields) in place must call this afterwards.
+        """
+        self._txid = None
+        self._txid_bytes = None
+        self._size = None
+        self._output_value = None
+        self._serialized = None
+
+    def get_output_value(self) -> int:
+        """
+        Return the total value of this transaction's outputs in satoshis.
+
+        Memoized until ``_dirty()`` is called.
+
+        Returns:
+            Sum of all output values.
+        """
+        if self._output_value is None:
+            self._output_value = sum(txout.value for txout in self.outputs)
+        return self._output_value
+
+    def get_size(self) -> int:
+        """
+        Return the serialized size of this transaction in bytes.
+
+        The size is computed from the field widths rather than by
+        serializing, and memoized until ``_dirty()`` is called.
+
+        Returns:
+            Size in bytes.
+        """
+        if self._size is None:
+            self._size = (
+                8  # version + locktime
+                + varint_size(len(self.inputs))
+                + sum(txin.get_size() for txin in self.inputs)
+                + varint_size(len(self.outputs))
+                + sum(txout.get_size() for txout in self.outputs)
+            )
+        return self._size
+
+    def serialize(self, out: Optional[bytearray] = None) -> bytes:
         """
         Serialize this transaction to Bitcoin wire format.
 
@@ -426,27 +737,65 @@ class Transaction:
             - outputs: serialized sequentially
             - locktime: 4 bytes, little-endian
 
+        The bytes are memoized until ``_dirty()`` is called, so computing
+        the txid, signing and block serialization share one encoding.
+
+        Args:
+            out: Optional buffer to append to (e.g. a whole block being
+                 serialized).
+
+        Returns:
+            Complete serialized transaction bytes, or *out* itself when a
+            buffer was given.
+        """
+        data = self._serialized
+        if data is None:
+            data = self._serialized = self._build()
+        if out is None:
+            return data
+        out += data
+        return out
+
+    def _build(self) -> bytes:
+        """
+        Encode the transaction fields into a fresh buffer.
+
+        Every field is appended to one ``bytearray`` instead of concatenating
+        ``bytes`` objects, which would copy the growing prefix on each step.
+
         Returns:
-            Complete serialized transaction bytes.
+            The serialized transaction bytes.
         """
-        result = int_to_little_endian(self.version, 4)
+        result = bytearray()
+        result += _U32.pack(self.version)
 
-        result += encode_varint(len(self.inputs))
+        n = len(self.inputs)
+        if n < 0xfd:
+            result.append(n)
+        else:
+            result += encode_varint(n)
         for txin in self.inputs:
-            result += txin.serialize()
+            txin.serialize(result)
 
-        result += encode_varint(len(self.outputs))
+        n = len(self.outputs)
+        if n < 0xfd:
+            result.append(n)
+        else:
+            result += encode_varint(n)
         for txout in self.outputs:
-            result += txout.serialize()
+            txout.serialize(result)
 
-        result += int_to_little_endian(self.locktime, 4)
-        return result
+        result += _U32.pack(self.locktime)
+        return bytes(result)
 
     @classmethod
     def deserialize(cls, data: bytes, offset: int = 0) -> tuple:
         """
         Deserialize a Transaction from binary data.
 
+        The consumed bytes are kept as the transaction's serialization
+        cache, so hashing it afterwards does not re-encode it.
+
         Args:
             data: Raw bytes containing the serialized transaction.
             offset: Starting byte position.
@@ -456,36 +805,50 @@ class Transaction:
         """
         start = offset
 
-        version = little_endian_to_int(data[offset:offset + 4])
+        version = _U32.unpack_from(data, offset)[0]
         offset += 4
 
-        input_count, varint_size = decode_varint(data, offset)
-        offset += varint_size
+        input_count = data[offset]
+        if input_count < 0xfd:
+            offset += 1
+        else:
+            input_count, consumed = decode_varint(data, offset)
+            offset += consumed
 
+        # Bind the per-item parsers and appenders once; these loops run for
+        # every input and output in a block
         inputs = []
+        parse_input, add_input = TransactionInput.deserialize, inputs.append
         for _ in range(input_count):
-            txin, consumed = TransactionInput.deserialize(data, offset)
-            inputs.append(txin)
+            txin, consumed = parse_input(data, offset)
+            add_input(txin)
             offset += consumed
 
-        output_count, varint_size = decode_varint(data, offset)
-        offset += varint_size
+        output_count = data[offset]
+        if output_count < 0xfd:
+            offset += 1
+        else:
+            output_count, consumed = decode_varint(data, offset)
+            offset += consumed
 
         outputs = []
+        parse_output, add_output = TransactionOutput.deserialize, outputs.append
         for _ in range(output_count):
-            txout, consumed = TransactionOutput.deserialize(data, offset)
-            outputs.append(txout)
+            txout, consumed = parse_output(data, offset)
+            add_output(txout)
             offset += consumed
 
-        locktime = little_endian_to_int(data[offset:offset + 4])
+        locktime = _U32.unpack_from(data, offset)[0]
         offset += 4
 
-        return (cls(
+        tx = cls(
             version=version,
             inputs=inputs,
             outputs=outputs,
             locktime=locktime,
-        ), offset - start)
+        )
+        tx._serialized = bytes(data[start:offset])
+        return tx, offset - start
 
     def is_coinbase(self) -> bool:
         """
@@ -527,19 +890,18 @@ class Transaction:
         if utxo_set is None:
             raise ValueError("UTXO set required to calculate fee for non-coinbase transactions")
 
-        total_input = 0
-        for txin in self.inputs:
-            utxo = utxo_set.get_utxo(txin.previous_txid, txin.previous_output_index)
+        utxos = utxo_set.get_many(
+            (txin.previous_txid, txin.previous_output_index) for txin in self.inputs
+        )
+        for txin, utxo in zip(self.inputs, utxos):
             if utxo is None:
                 raise ValueError(
                     f"Input references non-existent UTXO: "
                     f"{txin.previous_txid}:{txin.previous_output_index}"
                 )
-            total_input += utxo.value
-
-        total_output = sum(txout.value for txout in self.outputs)
+        total_input = sum(utxo.value for utxo in utxos)
 
-        return total_input - total_output
+        return total_input - self.get_output_value()
 
     def to_dict(self) -> dict:
         """
@@ -578,6 +940,61 @@ class Transaction:
             tx._txid = data['txid']
         return tx
 
+    @staticmethod
+    def _coinbase_script(block_height: int, extra_nonce: int) -> bytes:
+        """
+        Build the coinbase input script for a block height and extra nonce.
+
+        Args:
+            block_height: The height of the block (BIP 34).
+            extra_nonce: Additional nonce value for mining.
+
+        Returns:
+            The raw script bytes.
+        """
+        # Encode block height as little-endian bytes for the signature script
+        # BIP 34 requires the block height to be serialized in the coinbase
+        if block_height == 0:
+            height_bytes = b'\x00'
+        else:
+            # Calculate minimum bytes needed
+            byte_length = (block_height.bit_length() + 7) // 8
+            height_bytes = block_height.to_bytes(byte_length, byteorder='little')
+
+        # Script format: <height_length> <height> <extra_nonce_as_8_bytes>
+        extra_nonce_bytes = extra_nonce.to_bytes(8, byteorder='little')
+        return bytes([len(height_bytes)]) + height_bytes + extra_nonce_bytes
+
+    @staticmethod
+    def create_coinbase_bytes(
+        block_height: int,
+        reward_address: str,
+        reward_amount: int,
+        extra_nonce: int = 0,
+    ) -> bytes:
+        """
+        Serialize a coinbase transaction without building its objects.
+
+        Everything in a coinbase except the height/extra-nonce script, the
+        reward and the payout script is fixed, so the wire bytes are the
+        precomputed template pieces joined around those three fields.
+
+        Args:
+            block_height: The height of the block this coinbase belongs to.
+            reward_address: Hex-encoded public key hash of the miner.
+            reward_amount: Total reward in satoshis (subsidy + fees).
+            extra_nonce: Additional nonce value for mining (default 0).
+
+        Returns:
+            The serialized coinbase, identical to
+            ``create_coinbase(...).serialize()``.
+        """
+        return _join_coinbase(
+            Transaction._coinbase_script(block_height, extra_nonce),
+            reward_amount,
+            bytes.fromhex(reward_address),
+        )
+
     @staticmethod
     def create_coinbase(
         block_height: int,
@@ -605,25 +1022,12 @@ class Transaction:
         Returns:
             A new coinbase Transaction.
         """
-        # Encode block height as little-endian bytes for the signature script
-        # BIP 34 requires the block height to be serialized in the coinbase
-        if block_height == 0:
-            height_bytes = b'\x00'
-        else:
-            # Calculate minimum bytes needed
-            byte_length = (block_height.bit_length() + 7) // 8
-            height_bytes = block_height.to_bytes(byte_length, byteorder='little')
-
-        # Script format: <height_length> <height> <extra_nonce_as_8_bytes>
-        extra_nonce_bytes = extra_nonce.to_bytes(8, byteorder='little')
-        coinbase_script = (
-            bytes([len(height_bytes)]) + height_bytes + extra_nonce_bytes
-        )
+        coinbase_script = Transaction._coinbase_script(block_height, extra_nonce)
 
         coinbase_input = TransactionInput(
-            previous_txid="0" * 64,
-            previous_output_index=0xffffffff,
-            signature_script=bytes_to_hex(coinbase_script),
+            previous_txid=_COINBASE_TXID_HEX,
+            previous_output_index=_COINBASE_OUTPUT_INDEX,
+            signature_script=coinbase_script,
             sequence=0xffffffff,
         )
 
@@ -632,12 +1036,18 @@ class Transaction:
             pubkey_script=reward_address,
         )
 
-        return Transaction(
+        tx = Transaction(
             version=1,
             inputs=[coinbase_input],
             outputs=[coinbase_output],
             locktime=0,
         )
+        # Seed the serialization cache from the template so hashing the
+        # coinbase does not walk the object graph
+        tx._serialized = _join_coinbase(
+            coinbase_script, reward_amount, coinbase_output.pubkey_script_bytes
+        )
+        return tx
 
     def __repr__(self) -> str:
         return (
@@ -646,9 +1056,13 @@ class Transaction:
         )
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Transaction):
             return NotImplemented
-        return self.txid == other.txid
+        return self.txid_bytes == other.txid_bytes
 
     def __hash__(self) -> int:
-        return hash(self.txid)
+        # The digest is memoized and bytes caches its own hash, so this
+        # hashes the transaction at most once
+        return hash(self.txid_bytes)
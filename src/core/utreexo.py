@@ -0,0 +1,341 @@
+"""
+Utreexo-style hash accumulator for the UTXO set.
+
+A full node keeps every unspent output in memory (see ``UTXOSet``). Utreexo
+replaces that with a *commitment*: a small forest of Merkle trees whose
+roots commit to the hash of every UTXO. A node holding only the roots can
+check that an output is unspent when it is given an inclusion proof, so the
+state it must store shrinks from O(N) entries to O(log N) roots.
+
+This module provides:
+
+- **UtreexoAccumulator**: The Merkle forest. Leaves are kept in a single
+  position-ordered sequence split into perfect binary trees, one per set bit
+  of the leaf count (like a binary counter). Adding a leaf merges trees of
+  equal size; deleting a leaf moves the last leaf into its slot and shrinks
+  the forest. Both cost O(log N) hashes, and proofs are O(log N) sibling
+  hashes.
+
+- **BridgeUTXOSet**: A ``UTXOSet`` that mirrors every change into an
+  accumulator, so the chain can publish the current roots and produce
+  proofs for any UTXO. This is the Utreexo "bridge node" role: it serves
+  proofs to clients that only hold the roots. It does not save memory; it
+  keeps the full entries *and* the whole forest, so it uses more than a
+  plain ``UTXOSet``.
+
+Simplifications compared to the Utreexo paper: deletion uses the
+"swap with last leaf" rule instead of the paper's sibling promotion, and
+the accumulator keeps the whole forest so it can generate proofs.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Optional
+
+from src.crypto.hash import sha256, double_sha256
+from src.core.utxo import UTXOEntry, UTXOSet
+
+
+def utxo_leaf_hash(txid: str, index: int, entry: UTXOEntry) -> bytes:
+    """
+    Compute the accumulator leaf committing to one UTXO.
+
+    Args:
+        txid: Transaction ID that created the output.
+        index: Output index within the transaction.
+        entry: The UTXO's metadata.
+
+    Returns:
+        The 32-byte leaf hash.
+    """
+    return double_sha256(
+        bytes.fromhex(txid)
+        + struct.pack('<IqI?', index, entry.value, entry.block_height, entry.is_coinbase)
+        + bytes.fromhex(entry.pubkey_script)
+    )
+
+
+# ---------------------------------------------------------------------------
+# UtreexoAccumulator
+# ---------------------------------------------------------------------------
+
+class UtreexoAccumulator:
+    """
+    A dynamic Merkle forest committing to a set of 32-byte leaf hashes.
+
+    Node ``(h, i)`` is the root of the subtree over leaf positions
+    ``[i * 2**h, (i + 1) * 2**h)`` and exists while all those positions are
+    filled. The roots are the largest existing nodes, one per set bit of the
+    leaf count.
+
+    Attributes:
+        num_leaves: Number of leaves currently in the accumulator.
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.num_leaves = 0
+        self._nodes: dict[tuple[int, int], bytes] = {}
+        self._positions: dict[bytes, int] = {}
+
+    def _exists(self, height: int, index: int) -> bool:
+        """Return True if node ``(height, index)`` is complete."""
+        return (index + 1) << height <= self.num_leaves
+
+    def _update_path(self, position: int) -> None:
+        """Recompute every existing ancestor of the leaf at *position*."""
+        nodes = self._nodes
+        height, index = 0, position
+        while self._exists(height + 1, index >> 1):
+            left = index & ~1
+            nodes[(height + 1, index >> 1)] = sha256(
+                nodes[(height, left)] + nodes[(height, left + 1)]
+            )
+            height, index = height + 1, index >> 1
+
+    def add(self, leaf_hash: bytes) -> None:
+        """
+        Append a leaf to the forest.
+
+        Args:
+            leaf_hash: 32-byte hash to commit to.
+
+        Raises:
+            ValueError: If the leaf is already in the accumulator.
+        """
+        if leaf_hash in self._positions:
+            raise ValueError(f"Leaf already present: {leaf_hash.hex()[:16]}")
+        position = self.num_leaves
+        self.num_leaves += 1
+        self._nodes[(0, position)] = leaf_hash
+        self._positions[leaf_hash] = position
+        self._update_path(position)
+
+    def prove(self, leaf_hash: bytes) -> list:
+        """
+        Build an inclusion proof for a leaf.
+
+        Args:
+            leaf_hash: A leaf currently in the accumulator.
+
+        Returns:
+            The proof: a list of ``(position, sibling_hashes)`` where the
+            siblings run from the leaf level up to its tree's root.
+
+        Raises:
+            KeyError: If the leaf is not in the accumulator.
+        """
+        position = self._positions[leaf_hash]
+        siblings = []
+        height, index = 0, position
+        while self._exists(height + 1, index >> 1):
+            siblings.append(self._nodes[(height, index ^ 1)])
+            height, index = height + 1, index >> 1
+        return [position, siblings]
+
+    def verify(self, leaf_hash: bytes, proof: list) -> bool:
+        """
+        Check an inclusion proof against the current roots.
+
+        Only the roots are consulted, so this is the check a light client
+        holding just ``root()`` would perform.
+
+        Args:
+            leaf_hash: The leaf being proven.
+            proof: A proof as returned by ``prove()``.
+
+        Returns:
+            True if the proof hashes up to one of the roots.
+        """
+        position, siblings = proof
+        if not 0 <= position < self.num_leaves:
+            return False
+        node = leaf_hash
+        for height, sibling in enumerate(siblings):
+            if (position >> height) & 1:
+                node = sha256(sibling + node)
+            else:
+                node = sha256(node + sibling)
+        return node in self.root()
+
+    def delete(self, leaf_hash: bytes, proof: list) -> None:
+        """
+        Remove a leaf, given a valid inclusion proof for it.
+
+        The last leaf is moved into the deleted leaf's position and the trees
+        covering the old last position are dropped.
+
+        Args:
+            leaf_hash: The leaf to remove.
+            proof: An inclusion proof for *leaf_hash*.
+
+        Raises:
+            ValueError: If the proof does not verify.
+        """
+        if not self.verify(leaf_hash, proof) or self._positions.get(leaf_hash) != proof[0]:
+            raise ValueError(f"Invalid proof for leaf {leaf_hash.hex()[:16]}")
+
+        nodes = self._nodes
+        position = self._positions.pop(leaf_hash)
+        last = self.num_leaves - 1
+        last_leaf = nodes[(0, last)]
+
+        # Drop every node that covers the last position
+        height = 0
+        while self._exists(height, last >> height):
+            del nodes[(height, last >> height)]
+            height += 1
+        self.num_leaves = last
+
+        if position != last:
+            nodes[(0, position)] = last_leaf
+            self._positions[last_leaf] = position
+            self._update_path(position)
+
+    def root(self) -> list[bytes]:
+        """
+        Return the forest roots, largest tree first.
+
+        Returns:
+            One 32-byte root per set bit of ``num_leaves``.
+        """
+        result = []
+        start = 0
+        for height in range(self.num_leaves.bit_length() - 1, -1, -1):
+            if self.num_leaves & (1 << height):
+                result.append(self._nodes[(height, start >> height)])
+                start += 1 << height
+        return result
+
+    def copy(self) -> UtreexoAccumulator:
+        """
+        Create an independent copy of this accumulator.
+
+        Returns:
+            A new accumulator with the same forest and leaf positions.
+        """
+        new_acc = UtreexoAccumulator()
+        new_acc.num_leaves = self.num_leaves
+        new_acc._nodes = self._nodes.copy()
+        new_acc._positions = self._positions.copy()
+        return new_acc
+
+    def __contains__(self, leaf_hash: bytes) -> bool:
+        return leaf_hash in self._positions
+
+    def __len__(self) -> int:
+        return self.num_leaves
+
+    def __repr__(self) -> str:
+        return f"UtreexoAccumulator(leaves={self.num_leaves}, roots={len(self.root())})"
+
+
+# ---------------------------------------------------------------------------
+# BridgeUTXOSet
+# ---------------------------------------------------------------------------
+
+class BridgeUTXOSet(UTXOSet):
+    """
+    A proof-serving UTXO set that keeps a Utreexo accumulator in sync.
+
+    Every insertion adds the UTXO's leaf hash to ``accumulator`` and every
+    removal deletes it, so ``accumulator.root()`` always commits to the
+    exact current UTXO set and ``prove_utxo`` can answer any output.
+    The full entries and the whole forest are both kept in memory, so
+    this costs more than a plain ``UTXOSet``; use it only on nodes that
+    serve proofs.
+
+    Attributes:
+        accumulator: The UtreexoAccumulator mirroring the set.
+    """
+
+    def __init__(self):
+        """Initialize an empty UTXO set and accumulator."""
+        super().__init__()
+        self.accumulator = UtreexoAccumulator()
+
+    def _commit(self, key: tuple[str, int], entry: UTXOEntry) -> None:
+        txid, index = key
+        self.accumulator.add(utxo_leaf_hash(txid, index, entry))
+
+    def _uncommit(self, key: tuple[str, int], entry: UTXOEntry) -> None:
+        txid, index = key
+        leaf = utxo_leaf_hash(txid, index, entry)
+        self.accumulator.delete(leaf, self.accumulator.prove(leaf))
+
+    def add_utxo(self, txid, index, output, height, is_coinbase=False):
+        key = self._make_key(txid, index)
+        if key in self._utxos:
+            self._uncommit(key, self._utxos[key])
+        super().add_utxo(txid, index, output, height, is_coinbase)
+        self._commit(key, self._utxos[key])
+
+    def restore_utxo(self, txid, index, entry):
+        key = self._make_key(txid, index)
+        if key in self._utxos:
+            self._uncommit(key, self._utxos[key])
+        super().restore_utxo(txid, index, entry)
+        self._commit(key, entry)
+
+    def remove_utxo(self, txid, index):
+        entry = super().remove_utxo(txid, index)
+        self._uncommit(self._make_key(txid, index), entry)
+        return entry
+
+    def remove_utxo_if_present(self, txid, index):
+        entry = self._utxos.get(self._make_key(txid, index))
+        if entry is None:
+            return False
+        self.remove_utxo(txid, index)
+        return True
+
+    def apply_diff(self, removes, adds):
+        removed = []
+        for txid, index in removes:
+            entry = self._utxos.get(self._make_key(txid, index))
+            if entry is not None:
+                self.remove_utxo(txid, index)
+            removed.append(entry)
+        for (txid, index), entry in adds:
+            self.restore_utxo(txid, index, entry)
+        return removed
+
+    def prove_utxo(self, txid: str, index: int) -> Optional[list]:
+        """
+        Build an accumulator inclusion proof for a UTXO.
+
+        Args:
+            txid: Transaction ID.
+            index: Output index.
+
+        Returns:
+            The proof (see ``UtreexoAccumulator.prove``), or None if the
+            UTXO is not in the set.
+        """
+        entry = self.get_utxo(txid, index)
+        if entry is None:
+            return None
+        return self.accumulator.prove(utxo_leaf_hash(txid, index, entry))
+
+    def copy(self) -> BridgeUTXOSet:
+        """
+        Create an independent copy of this set and its accumulator.
+
+        Returns:
+            A new BridgeUTXOSet with the same entries and roots.
+        """
+        new_set = super().copy()
+        new_set.accumulator = self.accumulator.copy()
+        return new_set
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BridgeUTXOSet:
+        utxo_set = cls()
+        for key, entry_data in data['utxos'].items():
+            txid, index = key.rsplit(':', 1)
+            utxo_set.restore_utxo(txid, int(index), UTXOEntry.from_dict(entry_data))
+        return utxo_set
+
+    def __repr__(self) -> str:
+        return f"BridgeUTXOSet(size={self.size()}, roots={len(self.accumulator.root())})"
@@ -12,15 +12,19 @@ This module provides:
   locking script, the block height where it was created, and whether it came
   from a coinbase transaction (which has special maturity rules).
 
-- **UTXOSet**: An in-memory collection of all UTXOs, keyed by
-  ``"txid:output_index"``. It supports adding/removing UTXOs as blocks are
-  connected or disconnected, querying balances for addresses, and deep-copying
+- **UTXOSet**: An in-memory collection of all UTXOs, keyed by the
+  ``(txid, output_index)`` outpoint. It supports adding/removing UTXOs as blocks are
+  connected or disconnected, querying balances for addresses, and copying
   for fork handling.
+
+- **UTXOOverlay**: A copy-on-write view over a UTXOSet that records its own
+  additions and removals, for cheap scratch state such as validating the
+  transactions of a block.
 """
 
 from __future__ import annotations
 
-import copy
+import sys
 from typing import Optional
 
 from src.core.transaction import TransactionOutput
@@ -49,6 +53,10 @@ class UTXOEntry:
         is_coinbase: Whether this UTXO comes from a coinbase transaction.
     """
 
+    # Fixed attribute layout: the UTXO set holds one entry per unspent
+    # output, so dropping the per-instance __dict__ is its largest saving.
+    __slots__ = ('value', 'pubkey_script', 'block_height', 'is_coinbase')
+
     def __init__(
         self,
         value: int,
@@ -66,7 +74,9 @@ class UTXOEntry:
             is_coinbase: True if from a coinbase transaction.
         """
         self.value = value
-        self.pubkey_script = pubkey_script
+        # Interned: with address reuse many entries share one script, and
+        # each parsed output otherwise carries its own copy of the hex.
+        self.pubkey_script = sys.intern(pubkey_script)
         self.block_height = block_height
         self.is_coinbase = is_coinbase
 
@@ -133,18 +143,66 @@ class UTXOSet:
     added, spent inputs are removed) or disconnected during a chain
     reorganization (the reverse operations).
 
-    UTXOs are keyed by ``"txid:output_index"`` for O(1) lookup.
+    UTXOs are keyed by the ``(txid, output_index)`` outpoint for O(1)
+    lookup. A tuple key reuses the txid string (and its cached hash) instead
+    of formatting and hashing a fresh ``"txid:index"`` string per access;
+    the string form is only used in ``to_dict()``/``get_all_utxos()``.
+
+    A secondary index groups the entries by ``pubkey_script`` and keeps a
+    running balance per script, so address queries cost O(k) for the k
+    UTXOs of that address and ``get_balance`` is O(1), instead of scanning
+    the whole set.
 
     Attributes:
-        _utxos: Internal dictionary mapping ``"txid:index"`` to UTXOEntry.
+        _utxos: Internal dictionary mapping ``(txid, index)`` to UTXOEntry.
+        _by_script: ``pubkey_script`` -> ``{(txid, index): UTXOEntry}``.
+        _balance_by_script: ``pubkey_script`` -> total value in satoshis.
     """
 
     def __init__(self):
         """Initialize an empty UTXO set."""
-        self._utxos: dict[str, UTXOEntry] = {}
+        self._utxos: dict[tuple[str, int], UTXOEntry] = {}
+        self._by_script: dict[str, dict[tuple[str, int], UTXOEntry]] = {}
+        self._balance_by_script: dict[str, int] = {}
+
+    def _index(self, key: tuple[str, int], entry: UTXOEntry) -> None:
+        """Record *entry* in the per-script index and balance."""
+        script = entry.pubkey_script
+        bucket = self._by_script.get(script)
+        if bucket is None:
+            bucket = self._by_script[script] = {}
+        bucket[key] = entry
+        balances = self._balance_by_script
+        balances[script] = balances.get(script, 0) + entry.value
+
+    def _unindex(self, key: tuple[str, int], entry: UTXOEntry) -> None:
+        """Drop *entry* from the per-script index and balance."""
+        script = entry.pubkey_script
+        bucket = self._by_script[script]
+        del bucket[key]
+        if bucket:
+            self._balance_by_script[script] -= entry.value
+        else:
+            del self._by_script[script]
+            del self._balance_by_script[script]
+
+    def _put(self, key: tuple[str, int], entry: UTXOEntry) -> None:
+        """Store *entry* under *key*, replacing (and unindexing) any old one."""
+        old = self._utxos.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self._utxos[key] = entry
+        self._index(key, entry)
+
+    def _rebuild_index(self) -> None:
+        """Recompute the per-script index from ``_utxos``."""
+        self._by_script = {}
+        self._balance_by_script = {}
+        for key, entry in self._utxos.items():
+            self._index(key, entry)
 
     @staticmethod
-    def _make_key(txid: str, index: int) -> str:
+    def _make_key(txid: str, index: int) -> tuple[str, int]:
         """
         Create the dictionary key for a UTXO.
 
@@ -153,9 +211,9 @@ class UTXOSet:
             index: Output index within the transaction.
 
         Returns:
-            Key string in the format ``"txid:index"``.
+            The ``(txid, index)`` outpoint tuple.
         """
-        return f"{txid}:{index}"
+        return (txid, index)
 
     def add_utxo(
         self,
@@ -178,13 +236,59 @@ class UTXOSet:
             height: Block height where this output was confirmed.
             is_coinbase: Whether this output is from a coinbase transaction.
         """
-        key = self._make_key(txid, index)
-        self._utxos[key] = UTXOEntry(
+        self._put(self._make_key(txid, index), UTXOEntry(
             value=output.value,
             pubkey_script=output.pubkey_script,
             block_height=height,
             is_coinbase=is_coinbase,
-        )
+        ))
+
+    def restore_utxo(self, txid: str, index: int, entry: UTXOEntry):
+        """
+        Put back a previously removed UTXO entry as-is.
+
+        Used when a block is disconnected: the entries its inputs spent are
+        reinstated from the block's undo data.
+
+        Args:
+            txid: Transaction ID that created the output.
+            index: Output index within the transaction.
+            entry: The UTXOEntry returned when the output was spent.
+        """
+        self._put(self._make_key(txid, index), entry)
+
+    def apply_diff(self, removes: list, adds) -> list:
+        """
+        Apply a batch of removals followed by a batch of additions.
+
+        Lets a whole block's UTXO changes go through two tight loops instead
+        of one method call per input and output. Removals run first, so
+        the caller must already have dropped outputs that are created and
+        spent within the same batch.
+
+        Args:
+            removes: ``(txid, index)`` tuples to remove. Missing entries are
+                skipped.
+            adds: Iterable of ``((txid, index), UTXOEntry)`` pairs to add
+                (the outpoint must be a tuple; it is used as the key).
+
+        Returns:
+            The removed entries, aligned with *removes* (None where the
+            UTXO was not present).
+        """
+        utxos = self._utxos
+        index, unindex = self._index, self._unindex
+        removed = [utxos.pop(outpoint, None) for outpoint in removes]
+        for outpoint, entry in zip(removes, removed):
+            if entry is not None:
+                unindex(outpoint, entry)
+        for outpoint, entry in adds:
+            old = utxos.get(outpoint)
+            if old is not None:
+                unindex(outpoint, old)
+            utxos[outpoint] = entry
+            index(outpoint, entry)
+        return removed
 
     def remove_utxo(self, txid: str, index: int) -> UTXOEntry:
         """
@@ -208,7 +312,27 @@ class UTXOSet:
             raise KeyError(
                 f"UTXO not found: {txid}:{index}"
             )
-        return self._utxos.pop(key)
+        entry = self._utxos.pop(key)
+        self._unindex(key, entry)
+        return entry
+
+    def remove_utxo_if_present(self, txid: str, index: int) -> bool:
+        """
+        Remove a UTXO if it exists, without raising when it does not.
+
+        Args:
+            txid: Transaction ID of the output to remove.
+            index: Output index within the transaction.
+
+        Returns:
+            True if a UTXO was removed, False if it was not in the set.
+        """
+        key = self._make_key(txid, index)
+        entry = self._utxos.pop(key, None)
+        if entry is None:
+            return False
+        self._unindex(key, entry)
+        return True
 
     def get_utxo(self, txid: str, index: int) -> Optional[UTXOEntry]:
         """
@@ -224,6 +348,19 @@ class UTXOSet:
         key = self._make_key(txid, index)
         return self._utxos.get(key)
 
+    def get_many(self, outpoints) -> list:
+        """
+        Look up several UTXOs at once without removing them.
+
+        Args:
+            outpoints: Iterable of ``(txid, index)`` pairs.
+
+        Returns:
+            The UTXOEntry for each outpoint, in order (None where missing).
+        """
+        get = self._utxos.get
+        return [get((txid, index)) for txid, index in outpoints]
+
     def has_utxo(self, txid: str, index: int) -> bool:
         """
         Check whether a UTXO exists in the set.
@@ -247,6 +384,9 @@ class UTXOSet:
         the provided address string. In a full Bitcoin implementation, the
         address would be decoded and matched against the script pattern.
 
+        Served from the per-script index, so the cost depends only on the
+        number of matching UTXOs.
+
         Args:
             address: The address (pubkey_script hex) to search for.
 
@@ -254,20 +394,17 @@ class UTXOSet:
             A list of (txid, output_index, UTXOEntry) tuples for all
             matching UTXOs.
         """
-        results = []
-        for key, entry in self._utxos.items():
-            if entry.pubkey_script == address:
-                # Parse the key back to txid and index
-                txid, index_str = key.rsplit(':', 1)
-                results.append((txid, int(index_str), entry))
-        return results
+        bucket = self._by_script.get(address)
+        if not bucket:
+            return []
+        return [(txid, index, entry) for (txid, index), entry in bucket.items()]
 
     def get_balance(self, address: str) -> int:
         """
         Calculate the total balance for an address.
 
-        Sums the values of all UTXOs whose pubkey_script matches the
-        given address.
+        The sum of the values of all UTXOs whose pubkey_script matches the
+        given address, kept up to date as UTXOs are added and removed.
 
         Args:
             address: The address (pubkey_script hex) to query.
@@ -275,19 +412,17 @@ class UTXOSet:
         Returns:
             Total balance in satoshis.
         """
-        utxos = self.get_utxos_for_address(address)
-        return sum(entry.value for _, _, entry in utxos)
+        return self._balance_by_script.get(address, 0)
 
     def get_all_utxos(self) -> dict:
         """
         Return the entire UTXO set.
 
         Returns:
-            A dictionary mapping ``"txid:index"`` keys to UTXOEntry objects.
-            Note: this returns the internal dictionary directly for efficiency;
-            callers should not modify it.
+            A new dictionary mapping ``"txid:index"`` keys to UTXOEntry
+            objects.
         """
-        return dict(self._utxos)
+        return {f"{txid}:{index}": entry for (txid, index), entry in self._utxos.items()}
 
     def size(self) -> int:
         """
@@ -305,12 +440,20 @@ class UTXOSet:
         Returns:
             Dictionary with a 'utxos' key mapping to a dict of entries.
         """
-        return {
-            'utxos': {
-                key: entry.to_dict()
-                for key, entry in self._utxos.items()
-            }
-        }
+        return {'utxos': dict(self.iter_dict_items())}
+
+    def iter_dict_items(self):
+        """
+        Yield the ``'utxos'`` entries of ``to_dict()`` one at a time.
+
+        Lets a writer encode the set entry by entry instead of first
+        building the whole dictionary.
+
+        Yields:
+            ``("txid:index", entry_dict)`` pairs.
+        """
+        for (txid, index), entry in self._utxos.items():
+            yield f"{txid}:{index}", entry.to_dict()
 
     @classmethod
     def from_dict(cls, data: dict) -> UTXOSet:
@@ -324,27 +467,229 @@ class UTXOSet:
             A new UTXOSet instance with all entries restored.
         """
         utxo_set = cls()
+        utxos = utxo_set._utxos
+        new_entry = UTXOEntry.__new__
+        intern = sys.intern
+        # Entries are built without __init__ (as in UTXOEntry.__init__, the
+        # script is interned): a snapshot can hold millions of them.
         for key, entry_data in data['utxos'].items():
-            utxo_set._utxos[key] = UTXOEntry.from_dict(entry_data)
+            txid, index = key.rsplit(':', 1)
+            entry = new_entry(UTXOEntry)
+            entry.value = entry_data['value']
+            entry.pubkey_script = intern(entry_data['pubkey_script'])
+            entry.block_height = entry_data['block_height']
+            entry.is_coinbase = entry_data.get('is_coinbase', False)
+            utxos[(txid, int(index))] = entry
+        utxo_set._rebuild_index()
         return utxo_set
 
     def copy(self) -> UTXOSet:
         """
-        Create a deep copy of this UTXO set.
+        Create an independent copy of this UTXO set.
 
         This is essential for fork handling: when the blockchain needs to
         evaluate a competing chain, it creates a copy of the UTXO set and
         applies the alternative blocks to it without affecting the main set.
 
+        The dictionaries are copied but the entries are shared: a UTXOEntry
+        is never modified once stored (spending removes it, re-adding
+        stores a new one), so the copies cannot affect each other.
+
+        The copy has this set's own type, built without ``__init__``;
+        a subclass copies its extra state on top of the result.
+
         Returns:
-            A new UTXOSet with independent copies of all entries.
+            A new set that can be modified without touching this one.
         """
-        new_set = UTXOSet()
-        new_set._utxos = copy.deepcopy(self._utxos)
+        cls = type(self)
+        new_set = cls.__new__(cls)
+        new_set._utxos = self._utxos.copy()
+        new_set._by_script = {
+            script: bucket.copy() for script, bucket in self._by_script.items()
+        }
+        new_set._balance_by_script = self._balance_by_script.copy()
         return new_set
 
+    def overlay(self) -> UTXOOverlay:
+        """
+        Create a copy-on-write view of this UTXO set.
+
+        Unlike ``copy()``, this costs O(1) up front: changes made through
+        the view are kept in the view and never touch this set. Use it for
+        short-lived scratch state (e.g. validating a block's transactions)
+        while this set is not being modified.
+
+        Returns:
+            A UTXOOverlay over this set.
+        """
+        return UTXOOverlay(self)
+
     def __repr__(self) -> str:
         return f"UTXOSet(size={self.size()})"
 
     def __len__(self) -> int:
         return self.size()
+
+
+# ---------------------------------------------------------------------------
+# UTXOOverlay
+# ---------------------------------------------------------------------------
+
+class UTXOOverlay:
+    """
+    A copy-on-write layer over a UTXOSet.
+
+    Additions and removals are recorded in the overlay; lookups consult the
+    overlay first and fall back to the base set. Creating one is O(1) and
+    its memory grows only with the changes made through it, instead of the
+    O(N) copy ``UTXOSet.copy()`` performs.
+
+    The base set must not change while the overlay is in use.
+
+    Attributes:
+        _base: The underlying UTXOSet (never modified by the overlay).
+        _additions: Entries added through the overlay, keyed by outpoint.
+        _deletions: Base outpoints removed through the overlay.
+    """
+
+    def __init__(self, base: UTXOSet):
+        """
+        Initialize an empty overlay.
+
+        Args:
+            base: The UTXO set to layer over.
+        """
+        self._base = base
+        self._additions: dict[tuple[str, int], UTXOEntry] = {}
+        self._deletions: set[tuple[str, int]] = set()
+        self._size = base.size()
+
+    def get_utxo(self, txid: str, index: int) -> Optional[UTXOEntry]:
+        """
+        Look up a UTXO through the overlay.
+
+        Args:
+            txid: Transaction ID.
+            index: Output index.
+
+        Returns:
+            The UTXOEntry if it exists in the overlaid view, otherwise None.
+        """
+        key = (txid, index)
+        entry = self._additions.get(key)
+        if entry is not None:
+            return entry
+        if key in self._deletions:
+            return None
+        return self._base.get_utxo(txid, index)
+
+    def has_utxo(self, txid: str, index: int) -> bool:
+        """Return True if the UTXO exists in the overlaid view."""
+        return self.get_utxo(txid, index) is not None
+
+    def get_many(self, outpoints) -> list:
+        """Look up several ``(txid, index)`` outpoints (None where missing)."""
+        return [self.get_utxo(txid, index) for txid, index in outpoints]
+
+    def restore_utxo(self, txid: str, index: int, entry: UTXOEntry):
+        """
+        Put a UTXO entry into the overlaid view as-is.
+
+        Args:
+            txid: Transaction ID that created the output.
+            index: Output index within the transaction.
+            entry: The UTXOEntry to store.
+        """
+        if self.get_utxo(txid, index) is None:
+            self._size += 1
+        self._additions[(txid, index)] = entry
+
+    def add_utxo(
+        self,
+        txid: str,
+        index: int,
+        output: TransactionOutput,
+        height: int,
+        is_coinbase: bool = False,
+    ):
+        """
+        Add a new unspent output to the overlaid view.
+
+        Args:
+            txid: Transaction ID that created this output.
+            index: Output index within the transaction.
+            output: The TransactionOutput object.
+            height: Block height where this output was confirmed.
+            is_coinbase: Whether this output is from a coinbase transaction.
+        """
+        self.restore_utxo(txid, index, UTXOEntry(
+            value=output.value,
+            pubkey_script=output.pubkey_script,
+            block_height=height,
+            is_coinbase=is_coinbase,
+        ))
+
+    def remove_utxo(self, txid: str, index: int) -> UTXOEntry:
+        """
+        Remove and return a UTXO from the overlaid view.
+
+        Args:
+            txid: Transaction ID of the output to remove.
+            index: Output index within the transaction.
+
+        Returns:
+            The removed UTXOEntry.
+
+        Raises:
+            KeyError: If the UTXO does not exist in the overlaid view.
+        """
+        entry = self.get_utxo(txid, index)
+        if entry is None:
+            raise KeyError(f"UTXO not found: {txid}:{index}")
+        key = (txid, index)
+        self._additions.pop(key, None)
+        if self._base.has_utxo(txid, index):
+            self._deletions.add(key)
+        self._size -= 1
+        return entry
+
+    def remove_utxo_if_present(self, txid: str, index: int) -> bool:
+        """
+        Remove a UTXO from the overlaid view if it exists.
+
+        Returns:
+            True if a UTXO was removed, False if it was not present.
+        """
+        if self.get_utxo(txid, index) is None:
+            return False
+        self.remove_utxo(txid, index)
+        return True
+
+    def commit(self) -> UTXOSet:
+        """
+        Fold the overlay's changes into a new, independent set.
+
+        Returns:
+            A copy of the base set (of the base's own class, see
+            ``UTXOSet.copy``) with the overlay's removals and additions
+            applied. The base set itself is left unchanged.
+        """
+        result = self._base.copy()
+        for txid, index in self._deletions:
+            result.remove_utxo_if_present(txid, index)
+        for (txid, index), entry in self._additions.items():
+            result.restore_utxo(txid, index, entry)
+        return result
+
+    def size(self) -> int:
+        """Return the number of UTXOs in the overlaid view."""
+        return self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return (
+            f"UTXOOverlay(size={self._size}, added={len(self._additions)}, "
+            f"removed={len(self._deletions)})"
+        )
@@ -1,13 +1,19 @@
 # Cryptographic functions and key management
 
-from .hash import sha256, double_sha256, hash256, ripemd160, hash160, hash160_hex
+from .hash import (
+    sha256, sha256_hasher, SHA256_BACKEND, double_sha256, double_sha256_many,
+    hash256, ripemd160, hash160, hash160_hex,
+)
 from .keys import PrivateKey, PublicKey, KeyPair, sign_transaction_input, verify_transaction_input
-from .merkle import MerkleTree, compute_merkle_root
+from .merkle import MerkleTree, compute_merkle_root, merkle_root_bytes
 
 __all__ = [
     # Hash functions
     'sha256',
+    'sha256_hasher',
+    'SHA256_BACKEND',
     'double_sha256',
+    'double_sha256_many',
     'hash256',
     'ripemd160',
     'hash160',
@@ -21,4 +27,5 @@ __all__ = [
     # Merkle tree
     'MerkleTree',
     'compute_merkle_root',
+    'merkle_root_bytes',
 ]
@@ -42,13 +42,66 @@ WIF is a Base58Check-encoded format for private keys that includes:
 - A 4-byte checksum (first 4 bytes of double-SHA-256 of the above)
 """
 
+from functools import lru_cache
+
 import ecdsa
 from ecdsa import SECP256k1, SigningKey, VerifyingKey
-from ecdsa.util import sigencode_der, sigdecode_der
+from ecdsa.util import sigencode_der, sigdecode_der, sigencode_der_canonize
 
 from .hash import double_sha256, hash160
 from src.utils.encoding import base58check_encode, base58check_decode
 
+# Compressed-key prefix indexed by the parity of y: 0x02 even, 0x03 odd.
+_COMPRESSED_PREFIXES = (b'\x02', b'\x03')
+
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+
+# =============================================================================
+# Point Decompression
+# =============================================================================
+
+@lru_cache(maxsize=65536)
+def _decompress_point(data: bytes) -> bytes:
+    """
+    Recover the 64-byte ``x || y`` point from a 33-byte compressed key.
+
+    Uses libsecp256k1 through ``coincurve`` when it is installed, and the
+    curve equation otherwise. Memoized because the same keys are decoded
+    again every time their outputs are spent.
+
+    Args:
+        data: The compressed public key (0x02 or 0x03 prefix plus x).
+
+    Returns:
+        The uncompressed point without its 0x04 prefix.
+    """
+    if COINCURVE_AVAILABLE:
+        return coincurve.PublicKey(data).format(compressed=False)[1:]
+
+    x = int.from_bytes(data[1:], 'big')
+    p = SECP256k1.curve.p()
+
+    # Compute y^2 = x^3 + 7 (mod p)
+    y_squared = (pow(x, 3, p) + 7) % p
+
+    # Compute modular square root using Tonelli-Shanks
+    # For secp256k1, p % 4 == 3, so y = y_squared^((p+1)/4) mod p
+    y = pow(y_squared, (p + 1) // 4, p)
+
+    # Select the correct y based on the prefix byte
+    if data[0] == 0x02 and y % 2 != 0:
+        y = p - y
+    elif data[0] == 0x03 and y % 2 == 0:
+        y = p - y
+
+    # Construct the uncompressed point (64 bytes: x + y)
+    return data[1:] + y.to_bytes(32, 'big')
+
 
 # =============================================================================
 # PublicKey Class
@@ -79,6 +132,8 @@ class PublicKey:
             key: An ecdsa.VerifyingKey instance on the SECP256k1 curve.
         """
         self._key = key
+        self._compressed = None
+        self._cc_key = None
 
     def verify(self, message: bytes, signature: bytes) -> bool:
         """
@@ -91,6 +146,10 @@ class PublicKey:
         authorized by the holder of the private key corresponding to this
         public key.
 
+        When ``coincurve`` is installed the check runs in libsecp256k1,
+        with the signature first normalized to low-S (libsecp256k1 rejects
+        high-S signatures, which ``ecdsa`` accepts and produces).
+
         Args:
             message: The original message bytes (will be double-SHA-256 hashed).
             signature: The DER-encoded ECDSA signature to verify.
@@ -100,6 +159,12 @@ class PublicKey:
         """
         try:
             message_hash = double_sha256(message)
+            if COINCURVE_AVAILABLE:
+                if self._cc_key is None:
+                    self._cc_key = coincurve.PublicKey(self.to_bytes(compressed=True))
+                r, s = sigdecode_der(signature, SECP256k1.order)
+                low_s = sigencode_der_canonize(r, s, SECP256k1.order)
+                return self._cc_key.verify(low_s, message_hash, hasher=None)
             self._key.verify_digest(signature, message_hash, sigdecode=sigdecode_der)
             return True
         except (ecdsa.BadSignatureError, ecdsa.BadDigestError, Exception):
@@ -121,21 +186,23 @@ class PublicKey:
             has at most two valid y values (one even, one odd), we only need
             to store x and a single bit indicating which y to use. This saves
             32 bytes per public key.
+
+        The compressed form is cached after first computation; it backs
+        ``__eq__``, ``__hash__`` and address derivation.
         """
+        if compressed and self._compressed is not None:
+            return self._compressed
+
         # Get the raw uncompressed point (64 bytes: 32 for x, 32 for y)
         raw = self._key.to_string()
-        x = raw[:32]
-        y = raw[32:]
 
         if not compressed:
             # Uncompressed: 0x04 + x + y
-            return b'\x04' + x + y
+            return b'\x04' + raw
 
-        # Compressed: check if y is even or odd
-        if y[-1] % 2 == 0:
-            return b'\x02' + x
-        else:
-            return b'\x03' + x
+        # Compressed: the prefix is picked by y's parity (its last bit)
+        self._compressed = _COMPRESSED_PREFIXES[raw[63] & 1] + raw[:32]
+        return self._compressed
 
     def to_hex(self, compressed: bool = True) -> str:
         """
@@ -204,7 +271,7 @@ class PublicKey:
         - 33 bytes starting with 0x03: compressed (odd y)
 
         For compressed keys, the full y coordinate is recovered from the
-        curve equation y^2 = x^3 + 7 (mod p).
+        curve equation y^2 = x^3 + 7 (mod p) (see ``_decompress_point``).
 
         Args:
             data: The serialized public key bytes.
@@ -221,26 +288,7 @@ class PublicKey:
             return cls(key)
         elif len(data) == 33 and data[0] in (0x02, 0x03):
             # Compressed format: recover y from x
-            x = int.from_bytes(data[1:], 'big')
-            p = SECP256k1.curve.p()
-
-            # Compute y^2 = x^3 + 7 (mod p)
-            y_squared = (pow(x, 3, p) + 7) % p
-
-            # Compute modular square root using Tonelli-Shanks
-            # For secp256k1, p % 4 == 3, so y = y_squared^((p+1)/4) mod p
-            y = pow(y_squared, (p + 1) // 4, p)
-
-            # Select the correct y based on the prefix byte
-            if data[0] == 0x02 and y % 2 != 0:
-                y = p - y
-            elif data[0] == 0x03 and y % 2 == 0:
-                y = p - y
-
-            # Construct the uncompressed point (64 bytes: x + y)
-            x_bytes = x.to_bytes(32, 'big')
-            y_bytes = y.to_bytes(32, 'big')
-            key = VerifyingKey.from_string(x_bytes + y_bytes, curve=SECP256k1)
+            key = VerifyingKey.from_string(_decompress_point(bytes(data)), curve=SECP256k1)
             return cls(key)
         else:
             raise ValueError(
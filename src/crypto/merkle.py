@@ -36,7 +36,7 @@ Simplified Payment Verification (SPV) clients described in Section 8 of
 the Bitcoin whitepaper.
 """
 
-from .hash import double_sha256
+from .hash import double_sha256, double_sha256_many
 
 
 class MerkleTree:
@@ -125,19 +125,16 @@ class MerkleTree:
 
         # Build layers until we reach a single root
         while len(current_layer) > 1:
-            next_layer = []
-
             # If odd number of elements, duplicate the last one
             # This is Bitcoin's specific behavior for Merkle trees
             if len(current_layer) % 2 != 0:
                 current_layer = current_layer + [current_layer[-1]]
 
-            # Hash pairs of nodes
-            for i in range(0, len(current_layer), 2):
-                left = current_layer[i]
-                right = current_layer[i + 1]
-                parent = double_sha256(left + right)
-                next_layer.append(parent)
+            # Hash pairs of nodes, the whole layer in one batch
+            next_layer = double_sha256_many(
+                current_layer[i] + current_layer[i + 1]
+                for i in range(0, len(current_layer), 2)
+            )
 
             self._tree.append(next_layer)
             current_layer = next_layer
@@ -257,6 +254,31 @@ class MerkleTree:
         return current.hex() == root_hash
 
 
+def merkle_root_bytes(leaves: list) -> bytes:
+    """
+    Compute a Merkle root over raw 32-byte leaf hashes.
+
+    Each level is joined into one contiguous buffer and the pairs are hashed
+    from 64-byte ``memoryview`` slices of it, so no per-pair concatenation
+    objects are created. Leaves are used in the byte order given; callers
+    decide whether that is display or internal order.
+
+    Args:
+        leaves: Non-empty list of 32-byte hashes.
+
+    Returns:
+        The 32-byte Merkle root (the single leaf if there is only one).
+    """
+    level = list(leaves)
+    while len(level) > 1:
+        # If odd number of elements, duplicate the last one
+        if len(level) % 2 != 0:
+            level.append(level[-1])
+        view = memoryview(b"".join(level))
+        level = double_sha256_many(view[i:i + 64] for i in range(0, len(view), 64))
+    return level[0]
+
+
 def compute_merkle_root(tx_hashes: list) -> str:
     """
     Compute the Merkle root from a list of transaction hashes.
@@ -283,6 +305,4 @@ def compute_merkle_root(tx_hashes: list) -> str:
     if len(tx_hashes) == 1:
         return tx_hashes[0].lower()
 
-    tree = MerkleTree(tx_hashes)
-    tree.build_tree()
-    return tree.get_root()
+    return merkle_root_bytes([bytes.fromhex(h) for h in tx_hashes]).hex()
@@ -47,9 +47,12 @@ the target decreases, requiring more hash attempts on average to find a valid bl
 
 from __future__ import annotations
 
+import struct
 import time
 from typing import TYPE_CHECKING
 
+from src.crypto.hash import sha256_hasher
+
 if TYPE_CHECKING:
     from src.core.block import Block, BlockHeader
     from src.core.transaction import Transaction
@@ -281,8 +284,8 @@ class Miner:
         # Instant mining mode: skip PoW entirely (for testing/development)
         if self.instant_mine:
             block.header.nonce = 0
-            # Force a hash recalculation by calling calculate_hash
-            block.header.calculate_hash()
+            # Drop any hash cached before the nonce changed
+            block.header._hash = None
             return block
 
         # Derive target from difficulty_bits if not explicitly provided
@@ -294,14 +297,25 @@ class Miner:
 
         start_time = time.time()
 
+        sha256 = sha256_hasher
+        pack_nonce = struct.Struct('<I').pack
+
         while self._mining:
+            # Everything but the nonce is fixed for this pass, so hash the
+            # first 64 header bytes once and only finish the last block per
+            # attempt.
+            header = block.header
+            midstate, tail = header.hash_midstate()
+
             # Search the entire 32-bit nonce space
             for nonce in range(max_nonce):
                 if not self._mining:
                     raise RuntimeError("Mining was stopped externally.")
 
-                block.header.nonce = nonce
-                block_hash = block.header.calculate_hash()
+                header.nonce = nonce
+                inner = midstate.copy()
+                inner.update(tail + pack_nonce(nonce))
+                hash_bytes = sha256(inner.digest()).digest()[::-1]
 
                 self.hash_count += 1
 
@@ -316,13 +330,14 @@ class Miner:
                     )
 
                 # Check if the hash meets the difficulty target.
-                # The hash is a hex string; interpret it as a big-endian integer.
-                hash_int = int(block_hash, 16)
-                if hash_int < target:
+                # The raw hash is big-endian, so read it as an integer directly;
+                # hex is only produced once a block is found.
+                if int.from_bytes(hash_bytes, 'big') < target:
+                    header._hash = hash_bytes.hex()
                     elapsed = time.time() - start_time
                     print(
                         f"Block mined! Nonce: {nonce}, "
-                        f"Hash: {block_hash}, "
+                        f"Hash: {header.hash}, "
                         f"Hashes: {self.hash_count}, "
                         f"Time: {elapsed:.2f}s"
                     )
@@ -384,9 +399,11 @@ class Miner:
                 byteorder='little'
             )
             coinbase_input.signature_script = (
-                coinbase_input.signature_script + extra_nonce_bytes
+                coinbase_input.signature_script_bytes + extra_nonce_bytes
             )
 
+            coinbase_tx._dirty()
+
         # Recalculate the merkle root since the coinbase transaction changed
         block.header.merkle_root = block.calculate_merkle_root()
 
@@ -19,6 +19,12 @@ from src.crypto.hash import double_sha256
 # Base58 alphabet used by Bitcoin (excludes 0, O, I, l to avoid ambiguity)
 BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 
+# Lookup tables for the Base58 loops: every two-digit pair (so encoding
+# divides by 58**2 and halves the big-int divmods) and each character's
+# digit value (so decoding avoids scanning the alphabet per character).
+_BASE58_PAIRS = [a + b for a in BASE58_ALPHABET for b in BASE58_ALPHABET]
+_BASE58_DIGITS = {char: i for i, char in enumerate(BASE58_ALPHABET)}
+
 
 # ---------------------------------------------------------------------------
 # Hex / bytes conversions
@@ -172,11 +178,15 @@ def base58_encode(data: bytes) -> str:
     # Convert bytes to a large integer
     num = int.from_bytes(data, byteorder='big')
 
-    # Repeatedly divide by 58 to extract Base58 digits
-    result = ''
+    # Repeatedly divide by 58**2 to extract Base58 digits two at a time
+    pairs = []
     while num > 0:
-        num, remainder = divmod(num, 58)
-        result = BASE58_ALPHABET[remainder] + result
+        num, remainder = divmod(num, 3364)
+        pairs.append(_BASE58_PAIRS[remainder])
+    result = ''.join(reversed(pairs))
+    # The most significant pair may be padded with a zero digit ('1')
+    if result.startswith('1'):
+        result = result[1:]
 
     # Prepend '1' for each leading zero byte
     return '1' * num_leading_zeros + result
@@ -209,10 +219,12 @@ def base58_decode(s: str) -> bytes:
 
     # Convert from Base58 to integer
     num = 0
+    digits = _BASE58_DIGITS
     for char in s:
-        if char not in BASE58_ALPHABET:
+        digit = digits.get(char)
+        if digit is None:
             raise ValueError(f"Invalid Base58 character: '{char}'")
-        num = num * 58 + BASE58_ALPHABET.index(char)
+        num = num * 58 + digit
 
     # Convert integer to bytes
     if num == 0:
@@ -343,6 +355,34 @@ def encode_varint(value: int) -> bytes:
         return b'\xff' + int_to_little_endian(value, 8)
 
 
+def varint_size(value: int) -> int:
+    """
+    Return the number of bytes ``encode_varint(value)`` would produce.
+
+    Lets callers measure serialized sizes without building the bytes.
+
+    Args:
+        value: Non-negative integer.
+
+    Returns:
+        1, 3, 5 or 9.
+
+    Example:
+        >>> varint_size(252)
+        1
+        >>> varint_size(255)
+        3
+    """
+    if value < 0xfd:
+        return 1
+    elif value <= 0xffff:
+        return 3
+    elif value <= 0xffffffff:
+        return 5
+    else:
+        return 9
+
+
 def decode_varint(data: bytes, offset: int = 0) -> tuple:
     """
     Decode a Bitcoin variable-length integer from a byte stream.
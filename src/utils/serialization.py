@@ -109,11 +109,11 @@ def serialize_block(block) -> bytes:
     Returns:
         The serialized bytes of the entire block.
     """
-    result = block.header.serialize()
+    result = bytearray(block.header.serialize())
     result += encode_varint(len(block.transactions))
     for tx in block.transactions:
-        result += tx.serialize()
-    return result
+        tx.serialize(result)
+    return bytes(result)
 
 
 def deserialize_block(data: bytes, offset: int = 0):
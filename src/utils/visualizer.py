@@ -457,7 +457,7 @@ class BlockchainVisualizer:
         table.add_column("Output Value (sat)", justify="right", style="cyan")
         table.add_column("Fee Rate", justify="right", style="magenta")
 
-        for i, (fee_rate, txid) in enumerate(mempool._fee_index):
+        for i, (fee_rate, txid) in enumerate(mempool.get_fee_rates()):
             tx = mempool.transactions.get(txid)
             if tx is None:
                 continue
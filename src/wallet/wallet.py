@@ -411,8 +411,8 @@ class Wallet:
             pubkey_hex = keypair.public_key.to_hex(compressed=True)
             tx_input.signature_script = sig_hex + pubkey_hex
 
-        # Invalidate cached txid since the transaction content changed
-        tx._txid = None
+        # Invalidate cached txid/size since the transaction content changed
+        tx._dirty()
         return tx
 
     def send(self, to_address: str, amount: int, fee: int = 10000) -> Transaction:
@@ -11,6 +11,7 @@ Tests cover:
 - Block size calculation
 """
 
+import hashlib
 import time
 
 import pytest
@@ -79,6 +80,20 @@ class TestBlockHeader:
         hash2 = default_header.calculate_hash()
         assert hash1 == hash2
 
+    def test_hash_bytes_matches_hex_hash(self, default_header):
+        """hash_bytes should be the raw big-endian form of the hex hash."""
+        assert default_header.hash_bytes == bytes.fromhex(default_header.hash)
+        default_header._hash = None
+        assert default_header.hash_bytes.hex() == default_header.calculate_hash()
+
+    def test_hash_midstate_matches_full_hash(self):
+        """Finishing the midstate with a nonce should give the header hash."""
+        header = BlockHeader(timestamp=1000, difficulty_bits=0x1f0fffff, nonce=77)
+        midstate, tail = header.hash_midstate()
+        inner = midstate.copy()
+        inner.update(tail + (77).to_bytes(4, 'little'))
+        assert hashlib.sha256(inner.digest()).digest()[::-1] == header.hash_bytes
+
     def test_different_nonce_produces_different_hash(self):
         """Changing the nonce should change the hash."""
         h1 = BlockHeader(nonce=0, timestamp=1000, difficulty_bits=0x1f0fffff)
@@ -111,6 +126,12 @@ class TestBlockHeader:
         assert isinstance(target, int)
         assert target > 0
 
+    def test_get_target_edge_cases(self):
+        """Sign-bit targets are zero; oversized targets accept any hash."""
+        assert BlockHeader(difficulty_bits=0x1d80ffff).get_target() == 0
+        assert BlockHeader(difficulty_bits=0x1d80ffff).meets_difficulty_target() is False
+        assert BlockHeader(difficulty_bits=0x2200ffff).meets_difficulty_target() is True
+
     def test_to_dict_contains_required_fields(self, default_header):
         """to_dict should include all header fields."""
         d = default_header.to_dict()
@@ -214,6 +235,18 @@ class TestBlock:
         assert sample_block.header.merkle_root != old_root
         assert len(sample_block.transactions) == 2
 
+    def test_add_transaction_invalidates_hash(self, sample_block):
+        """Appending transactions should refresh the header hash on next read."""
+        old_hash = sample_block.header.hash
+        for height in (2, 3):
+            sample_block.add_transaction(Transaction.create_coinbase(
+                block_height=height,
+                reward_address="cc" * 20,
+                reward_amount=25_00000000,
+            ))
+        assert sample_block.header.merkle_root == sample_block.calculate_merkle_root()
+        assert sample_block.header.hash != old_hash
+
     def test_block_equality(self):
         """Two blocks with the same header hash should be equal."""
         h = BlockHeader(timestamp=12345, difficulty_bits=0x1f0fffff)
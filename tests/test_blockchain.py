@@ -12,11 +12,15 @@ Tests cover:
 - Difficulty retrieval
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from src.core.blockchain import Blockchain
+from src.crypto.keys import COINCURVE_AVAILABLE
 from src.core.block import Block, BlockHeader
-from src.core.transaction import Transaction
+from src.core.transaction import Transaction, TransactionInput, TransactionOutput
 from src.crypto.keys import KeyPair
 from src.mining.miner import Miner, create_block_template
 
@@ -123,6 +127,62 @@ class TestBlockAddition:
         coinbase_tx = block.transactions[0]
         assert coinbase_tx.outputs[0].pubkey_script == miner_address
 
+    def test_signature_pool_is_opt_in(self, blockchain):
+        """The validator pool should only exist when a GIL-free verifier is loaded."""
+        assert (blockchain._validator_pool is not None) == COINCURVE_AVAILABLE
+
+    def test_writer_thread_is_opt_in(self, blockchain):
+        """A default chain should add blocks on the caller's thread."""
+        assert blockchain._writer is None
+
+    @pytest.mark.parametrize("writer_thread", [False, True])
+    def test_concurrent_add_block(self, writer_thread):
+        """Concurrent add_block calls are serialized by the chain lock."""
+        with Blockchain(development_mode=True, writer_thread=writer_thread) as blockchain:
+            block = _mine_side_block(blockchain, blockchain.get_chain_tip(), 1)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(blockchain.add_block, [block] * 4))
+
+            assert results.count(True) == 1
+            assert blockchain.get_chain_height() == 1
+
+    @pytest.mark.parametrize("writer_thread", [False, True])
+    def test_export_while_mining(self, writer_thread, tmp_path):
+        """Exports running beside the miner should always see a consistent chain."""
+        with Blockchain(development_mode=True, writer_thread=writer_thread) as blockchain:
+            def mine():
+                for _ in range(20):
+                    blockchain.mine_next_block(coinbase_address="aa" * 20)
+
+            def export(index):
+                path = tmp_path / f"chain-{writer_thread}-{index}.json"
+                blockchain.export_to_json(str(path))
+                with open(path) as f:
+                    data = json.load(f)
+                assert len(data["blocks"]) == data["block_count"]
+                return blockchain.to_dict()["chain_height"]
+
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                miner = pool.submit(mine)
+                heights = list(pool.map(export, range(10)))
+                miner.result()
+
+            assert all(0 <= height <= 20 for height in heights)
+            assert blockchain.get_chain_height() == 20
+
+    def test_add_block_fast(self, blockchain, miner_address):
+        """add_block_fast should append a pre-validated block to the best tip."""
+        blockchain.mine_next_block(coinbase_address=miner_address)
+        stale_parent = blockchain.get_block_by_height(0)
+        block = _mine_side_block(blockchain, blockchain.get_chain_tip(), 1)
+
+        blockchain.add_block_fast(block)
+        assert blockchain.get_chain_tip() is block
+        assert blockchain.get_block_by_height(2) is block
+        assert blockchain.utxo_set.get_balance("ee" * 20) == 50_00000000
+        with pytest.raises(ValueError):
+            blockchain.add_block_fast(_mine_side_block(blockchain, stale_parent, 2))
+
 
 # ---------------------------------------------------------------------------
 # Chain State Tests
@@ -164,3 +224,166 @@ class TestChainState:
         blockchain.mine_next_block(coinbase_address=miner_address)
         balance = blockchain.utxo_set.get_balance(miner_address)
         assert balance > 0
+
+    def test_previous_timestamps_match_chain_walk(self, blockchain, miner_address):
+        """Tip timestamps from the ring buffer should match a parent walk."""
+        for _ in range(13):
+            tip = blockchain.mine_next_block(coinbase_address=miner_address)
+            for count in (1, 11, 20):
+                assert blockchain.get_previous_timestamps(tip.header.hash, count) == (
+                    blockchain._walk_timestamps(tip.header.hash, count)
+                )
+
+    def test_unwind_restores_spent_utxos(self, blockchain, miner_address):
+        """Unwinding a block should restore the UTXOs its inputs spent,
+        including when one transaction spends another from the same block."""
+        tip = blockchain.mine_next_block(coinbase_address=miner_address)
+        coinbase_txid = tip.transactions[0].txid
+        spend = Transaction(
+            inputs=[TransactionInput(coinbase_txid, 0)],
+            outputs=[TransactionOutput(1000, "bb" * 20)],
+        )
+        chained = Transaction(
+            inputs=[TransactionInput(spend.txid, 0)],
+            outputs=[TransactionOutput(900, "dd" * 20)],
+        )
+        block = Block(
+            header=BlockHeader(previous_block_hash=tip.header.hash),
+            transactions=[Transaction.create_coinbase(2, "cc" * 20, 1000), spend, chained],
+        )
+        block._height = 2
+        before = blockchain.utxo_set.get_all_utxos()
+
+        blockchain._apply_block(block)
+        assert not blockchain.utxo_set.has_utxo(coinbase_txid, 0)
+        assert not blockchain.utxo_set.has_utxo(spend.txid, 0)
+        assert blockchain.utxo_set.has_utxo(chained.txid, 0)
+
+        blockchain._unwind_block(block)
+        assert blockchain.utxo_set.get_all_utxos() == before
+
+
+# ---------------------------------------------------------------------------
+# Persistence Tests
+# ---------------------------------------------------------------------------
+
+class TestPersistence:
+    """Tests for exporting and re-importing the blockchain."""
+
+    def test_export_import_roundtrip(self, blockchain, miner_address, tmp_path):
+        """An exported chain should reload with the same tip and UTXO set."""
+        for _ in range(3):
+            blockchain.mine_next_block(coinbase_address=miner_address)
+        path = tmp_path / "chain.json"
+        blockchain.export_to_json(str(path))
+
+        with open(path) as f:
+            data = json.load(f)
+        assert data["blocks"] == blockchain.to_dict()["blocks"]
+        assert data["utxo_set"] == blockchain.utxo_set.to_dict()
+
+        restored = Blockchain.import_from_json(str(path))
+        assert restored.best_chain_tip == blockchain.best_chain_tip
+        assert restored.utxo_set.get_all_utxos() == blockchain.utxo_set.get_all_utxos()
+
+    def test_to_dict_returns_fresh_block_dicts(self, blockchain, miner_address, tmp_path):
+        """Editing one to_dict() result should not leak into later exports."""
+        blockchain.mine_next_block(coinbase_address=miner_address)
+        first = blockchain.to_dict()
+        for block_data in first["blocks"].values():
+            block_data.pop("height")
+        second = blockchain.to_dict()
+        assert all("height" in block_data for block_data in second["blocks"].values())
+
+        path = tmp_path / "chain.json"
+        blockchain.export_to_json(str(path))
+        with open(path) as f:
+            assert json.load(f)["blocks"] == second["blocks"]
+
+    def test_close_stops_worker_threads(self):
+        """close() should shut down the writer and validator pools."""
+        with Blockchain(
+            development_mode=True, writer_thread=True, parallel_signatures=True
+        ) as blockchain:
+            blockchain.mine_next_block(coinbase_address="aa" * 20)
+        threads = blockchain._writer._threads | blockchain._validator_pool._threads
+        assert not any(thread.is_alive() for thread in threads)
+        assert blockchain.get_chain_height() == 1
+        with pytest.raises(RuntimeError):
+            blockchain.mine_next_block(coinbase_address="aa" * 20)
+
+    def test_cbor_roundtrip(self, blockchain, miner_address, tmp_path):
+        """A CBOR export should reload to the same chain."""
+        pytest.importorskip("cbor2")
+        blockchain.mine_next_block(coinbase_address=miner_address)
+        path = tmp_path / "chain.cbor"
+        blockchain.export_to_cbor(str(path))
+
+        restored = Blockchain.import_from_cbor(str(path))
+        assert restored.best_chain_tip == blockchain.best_chain_tip
+        assert restored.utxo_set.get_all_utxos() == blockchain.utxo_set.get_all_utxos()
+
+
+# ---------------------------------------------------------------------------
+# Fork Tests
+# ---------------------------------------------------------------------------
+
+def _mine_side_block(blockchain, parent, extra_nonce):
+    """Mine a valid block on top of *parent*, which need not be the tip."""
+    height = parent.height + 1
+    block = create_block_template(
+        previous_block_hash=parent.header.hash,
+        height=height,
+        difficulty_bits=blockchain._get_next_difficulty(height),
+        transactions=[],
+        coinbase_address="ee" * 20,
+        reward_amount=50_00000000,
+        extra_nonce=extra_nonce,
+    )
+    return Miner().mine_block(block)
+
+
+class TestForks:
+    """Tests for fork handling and common-ancestor lookup."""
+
+    def test_side_block_is_stored_as_tip(self, blockchain, miner_address):
+        """A non-overtaking sibling is stored as an extra chain tip."""
+        for _ in range(3):
+            blockchain.mine_next_block(coinbase_address=miner_address)
+        tip = blockchain.get_chain_tip()
+        side = _mine_side_block(blockchain, blockchain.get_block_by_height(2), 1)
+
+        assert blockchain.add_block(side) is True
+        assert blockchain.get_chain_tip() is tip
+        assert set(blockchain.get_chain_tips()) == {tip.header.hash, side.header.hash}
+
+    def test_find_common_ancestor(self, blockchain, miner_address):
+        """Common ancestor is found against the best tip and between side tips."""
+        for _ in range(3):
+            blockchain.mine_next_block(coinbase_address=miner_address)
+        h1 = blockchain.get_block_by_height(1)
+        h2 = blockchain.get_block_by_height(2)
+        side_a = _mine_side_block(blockchain, h2, 1)
+        side_b = _mine_side_block(blockchain, h1, 2)
+        blockchain.add_block(side_a)
+        blockchain.add_block(side_b)
+        best = blockchain.best_chain_tip
+
+        assert blockchain._find_common_ancestor(best, side_a.header.hash) == h2.header.hash
+        assert blockchain._find_common_ancestor(side_a.header.hash, best) == h2.header.hash
+        assert blockchain._find_common_ancestor(side_a.header.hash, side_b.header.hash) == h1.header.hash
+
+    def test_longer_side_chain_triggers_reorg(self, blockchain, miner_address):
+        """A side chain that grows past the best chain becomes the best chain."""
+        for _ in range(3):
+            blockchain.mine_next_block(coinbase_address=miner_address)
+        old_tip = blockchain.get_chain_tip()
+        parent = blockchain.get_block_by_height(2)
+        for i in range(2):
+            parent = _mine_side_block(blockchain, parent, i + 1)
+            assert blockchain.add_block(parent) is True
+
+        assert blockchain.best_chain_tip == parent.header.hash
+        assert blockchain.get_block_by_height(3) is not old_tip
+        assert blockchain.utxo_set.get_balance(miner_address) == 2 * 50_00000000
+        assert blockchain.utxo_set.get_balance("ee" * 20) == 2 * 50_00000000
@@ -120,6 +120,28 @@ class TestTransactionFlow:
         # but Bob definitely got his money
         assert bob_balance == send_amount
 
+    def test_parallel_signature_checks(self):
+        """A chain that opts into the validator pool should confirm payments."""
+        with Blockchain(development_mode=True, parallel_signatures=True) as blockchain:
+            assert blockchain._validator_pool is not None
+            senders = []
+            for name in ("Alice", "Carol"):
+                wallet = Wallet(blockchain=blockchain, name=name)
+                addr = wallet.generate_address()
+                senders.append((wallet, wallet.get_keypair(addr).public_key.get_hash160()))
+            bob = Wallet(blockchain=blockchain, name="Bob")
+            bob_addr = bob.generate_address()
+
+            for _ in range(4):
+                for _, pubkey_hash in senders:
+                    blockchain.mine_next_block(coinbase_address=pubkey_hash)
+            for wallet, _ in senders:
+                wallet.send(to_address=bob_addr, amount=1_000_000, fee=10_000)
+
+            block = blockchain.mine_next_block(coinbase_address="ee" * 20)
+            assert len(block.transactions) == 3
+            assert bob.get_balance() == 2_000_000
+
     def test_chain_of_transactions(self, blockchain):
         """A -> B -> C chain of transactions should work."""
         # Setup three wallets
@@ -233,6 +233,12 @@ class TestPublicKey:
         restored = PublicKey.from_bytes(pub_bytes)
         assert restored.to_hex() == private_key.public_key.to_hex()
 
+    def test_compressed_bytes_cached(self, private_key):
+        """The compressed encoding should be computed once and reused."""
+        pub = private_key.public_key
+        assert pub.to_bytes() is pub.to_bytes(compressed=True)
+        assert pub.to_bytes(compressed=False)[1:33] == pub.to_bytes()[1:]
+
     def test_from_bytes_uncompressed(self, private_key):
         """PublicKey should be reconstructable from uncompressed bytes."""
         pub_bytes = private_key.public_key.to_bytes(compressed=False)
@@ -0,0 +1,99 @@
+"""
+Tests for Mempool
+==================
+
+Tests cover:
+- Fee-rate ordering of pending transactions
+- Removal and confirmation of transactions
+- Double-spend rejection
+"""
+
+import pytest
+
+from src.core.mempool import Mempool
+from src.core.transaction import Transaction, TransactionInput, TransactionOutput
+from src.core.utxo import UTXOSet
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+FUNDING_TXID = "ab" * 32
+
+
+@pytest.fixture
+def utxo_set():
+    """A UTXO set with ten 10,000-satoshi outputs to spend."""
+    utxo_set = UTXOSet()
+    output = TransactionOutput(value=10_000, pubkey_script="aa" * 20)
+    for i in range(10):
+        utxo_set.add_utxo(FUNDING_TXID, i, output, height=1)
+    return utxo_set
+
+
+def _spend(index: int, fee: int) -> Transaction:
+    """A transaction spending funding output *index* and paying *fee*."""
+    return Transaction(
+        inputs=[TransactionInput(FUNDING_TXID, index)],
+        outputs=[TransactionOutput(10_000 - fee, "bb" * 20)],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Mempool Tests
+# ---------------------------------------------------------------------------
+
+class TestMempool:
+    """Tests for Mempool."""
+
+    def test_orders_by_fee_rate(self, utxo_set):
+        """get_transactions should return the highest fee rate first."""
+        mempool = Mempool()
+        txs = [_spend(i, fee) for i, fee in enumerate([300, 100, 500, 100])]
+        for tx in txs:
+            assert mempool.add_transaction(tx, utxo_set) is True
+
+        assert mempool.get_transactions() == [txs[2], txs[0], txs[1], txs[3]]
+        assert mempool.get_transactions(limit=2) == [txs[2], txs[0]]
+        assert mempool.get_fee_rate(txs[2].txid) == 500 / txs[2].get_size()
+        assert mempool.get_fee_rate("ff" * 32) is None
+        assert [txid for _, txid in mempool.get_fee_rates()] == [
+            tx.txid for tx in mempool.get_transactions()
+        ]
+
+    def test_remove_and_readd(self, utxo_set):
+        """Removed transactions drop out of the ordering and can come back."""
+        mempool = Mempool()
+        txs = [_spend(i, 100 * (i + 1)) for i in range(5)]
+        for tx in txs:
+            mempool.add_transaction(tx, utxo_set)
+
+        assert mempool.remove_transaction(txs[4].txid) is txs[4]
+        assert mempool.clear_confirmed_ids({txs[0].txid, "ff" * 32}) == 1
+        assert mempool.get_transactions() == [txs[3], txs[2], txs[1]]
+
+        mempool.add_transaction(txs[4], utxo_set)
+        assert mempool.get_transactions() == [txs[4], txs[3], txs[2], txs[1]]
+
+    def test_rejects_double_spend(self, utxo_set):
+        """A second transaction spending the same outpoint is rejected."""
+        mempool = Mempool()
+        assert mempool.add_transaction(_spend(0, 100), utxo_set) is True
+        assert mempool.add_transaction(_spend(0, 200), utxo_set) is False
+        assert mempool.size == 1
+
+    def test_removal_frees_outpoint(self, utxo_set):
+        """Once the spender leaves the pool, its outpoint can be spent again."""
+        mempool = Mempool()
+        first = _spend(0, 100)
+        mempool.add_transaction(first, utxo_set)
+        mempool.remove_transaction(first.txid)
+        assert mempool.add_transaction(_spend(0, 200), utxo_set) is True
+
+    def test_precomputed_fee_rate(self):
+        """A fee rate passed by the caller is used without a UTXO lookup."""
+        mempool = Mempool()
+        tx = _spend(0, 100)
+        assert mempool.add_transaction(tx, fee_rate=12.5) is True
+        assert mempool.get_fee_rate(tx.txid) == 12.5
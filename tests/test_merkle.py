@@ -242,3 +242,11 @@ class TestComputeMerkleRoot:
         tree.build_tree()
         root2 = tree.get_root()
         assert root1 == root2
+
+    def test_matches_tree_build_odd_sizes(self):
+        """compute_merkle_root should match MerkleTree for odd leaf counts."""
+        for count in (3, 5, 7):
+            hashes = [hashlib.sha256(bytes([i])).hexdigest() for i in range(count)]
+            tree = MerkleTree(hashes)
+            tree.build_tree()
+            assert compute_merkle_root(hashes) == tree.get_root()
@@ -129,6 +129,13 @@ class TestTransactionInput:
         """Coinbase inputs should be identified correctly."""
         assert coinbase_input.is_coinbase() is True
 
+    def test_is_coinbase_after_deserialize(self, coinbase_input, sample_input):
+        """Parsed inputs keep their coinbase status."""
+        parsed, _ = TransactionInput.deserialize(coinbase_input.serialize())
+        assert parsed.is_coinbase() is True
+        parsed, _ = TransactionInput.deserialize(sample_input.serialize())
+        assert parsed.is_coinbase() is False
+
     def test_to_dict(self, sample_input):
         """to_dict should include all fields."""
         d = sample_input.to_dict()
@@ -167,6 +174,24 @@ class TestTransaction:
         assert len(coinbase_tx.outputs) == 1
         assert coinbase_tx.outputs[0].value == 50_00000000
 
+    def test_create_coinbase_bytes_matches_objects(self):
+        """The template serialization should match the object graph."""
+        for height, nonce in [(0, 0), (1, 0), (70_000, 12345)]:
+            tx = Transaction.create_coinbase(height, "aa" * 20, 50_00000000, nonce)
+            expected = Transaction.create_coinbase_bytes(height, "aa" * 20, 50_00000000, nonce)
+            assert tx._build() == expected
+            assert tx.serialize() == expected
+
+    def test_serialize_multibyte_varints(self, sample_input):
+        """Counts and scripts of 0xfd or more should use the long varint form."""
+        outputs = [TransactionOutput(value=i, pubkey_script="ab" * 300) for i in range(0xfd)]
+        tx = Transaction(inputs=[sample_input], outputs=outputs)
+        data = tx.serialize()
+        assert len(data) == tx.get_size()
+        restored, consumed = Transaction.deserialize(data)
+        assert consumed == len(data)
+        assert restored.outputs[-1].pubkey_script == "ab" * 300
+
     def test_txid_is_64_hex(self, coinbase_tx):
         """Transaction ID should be a 64-character hex string."""
         txid = coinbase_tx.txid
@@ -204,6 +229,48 @@ class TestTransaction:
         assert len(restored.outputs) == len(coinbase_tx.outputs)
         assert restored.outputs[0].value == coinbase_tx.outputs[0].value
 
+    def test_get_size_matches_serialize(self, coinbase_tx, regular_tx):
+        """get_size should equal the serialized length without serializing."""
+        assert coinbase_tx.get_size() == len(coinbase_tx.serialize())
+        assert regular_tx.get_size() == len(regular_tx.serialize())
+
+    def test_get_output_value(self, regular_tx):
+        """get_output_value should sum outputs and refresh after _dirty()."""
+        assert regular_tx.get_output_value() == 50_00000000
+        regular_tx.outputs.append(TransactionOutput(value=1000, pubkey_script="aa" * 20))
+        regular_tx._dirty()
+        assert regular_tx.get_output_value() == 50_00001000
+
+    def test_scripts_accept_raw_bytes(self):
+        """Scripts given as bytes should read back as hex and serialize the same."""
+        txout = TransactionOutput(value=1000, pubkey_script=bytes.fromhex("ab" * 20))
+        txin = TransactionInput("00" * 32, 0, signature_script=b"\x01\x02")
+        assert txout.pubkey_script == "ab" * 20
+        assert txin.signature_script == "0102"
+        assert txout.serialize() == TransactionOutput(1000, "ab" * 20).serialize()
+        assert txin.get_size() == len(txin.serialize())
+
+    def test_serialize_cache_invalidated_by_dirty(self, regular_tx):
+        """serialize() should be memoized and rebuilt after _dirty()."""
+        data = regular_tx.serialize()
+        assert regular_tx.serialize() is data
+        regular_tx.locktime = 7
+        regular_tx._dirty()
+        assert regular_tx.serialize() != data
+        assert regular_tx.serialize()[-4:] == (7).to_bytes(4, "little")
+
+    def test_txid_bytes_matches_hex(self, regular_tx):
+        """txid_bytes should be the internal-order form of txid."""
+        assert regular_tx.txid_bytes[::-1].hex() == regular_tx.txid
+        restored = Transaction.from_dict(regular_tx.to_dict())
+        assert restored.txid_bytes == regular_tx.txid_bytes
+
+    def test_calculate_txids_batch(self, coinbase_tx, regular_tx):
+        """Batch txids should match the one-at-a-time calculation."""
+        expected = [coinbase_tx.calculate_txid(), regular_tx.calculate_txid()]
+        assert Transaction.calculate_txids_batch([coinbase_tx, regular_tx]) == expected
+        assert regular_tx.txid == expected[1]
+
     def test_to_dict(self, coinbase_tx):
         """to_dict should contain all required fields."""
         d = coinbase_tx.to_dict()
@@ -0,0 +1,170 @@
+"""
+Tests for UtreexoAccumulator and BridgeUTXOSet
+==============================================
+
+Tests cover:
+- Adding leaves and the shape of the root set
+- Inclusion proofs and deletion
+- Keeping the accumulator in sync with a UTXO set
+- Running a blockchain with the utreexo_bridge backend and exporting it
+"""
+
+import pytest
+
+from src.core.blockchain import Blockchain
+from src.core.transaction import TransactionOutput
+from src.core.utxo import UTXOSet
+from src.core.utreexo import BridgeUTXOSet, UtreexoAccumulator, utxo_leaf_hash
+from src.crypto.hash import sha256
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _leaf(i: int) -> bytes:
+    return sha256(i.to_bytes(4, 'little'))
+
+
+def _assert_all_provable(acc: UtreexoAccumulator, leaves) -> None:
+    for leaf in leaves:
+        assert acc.verify(leaf, acc.prove(leaf))
+
+
+# ---------------------------------------------------------------------------
+# UtreexoAccumulator Tests
+# ---------------------------------------------------------------------------
+
+class TestUtreexoAccumulator:
+    """Tests for UtreexoAccumulator."""
+
+    def test_roots_follow_leaf_count_bits(self):
+        """There should be one root per set bit of the leaf count."""
+        acc = UtreexoAccumulator()
+        for i in range(13):
+            acc.add(_leaf(i))
+            assert len(acc.root()) == bin(i + 1).count('1')
+
+    def test_single_tree_root(self):
+        """Four leaves should hash into one ordinary Merkle root."""
+        acc = UtreexoAccumulator()
+        leaves = [_leaf(i) for i in range(4)]
+        for leaf in leaves:
+            acc.add(leaf)
+        expected = sha256(sha256(leaves[0] + leaves[1]) + sha256(leaves[2] + leaves[3]))
+        assert acc.root() == [expected]
+
+    def test_proofs_verify(self):
+        """Every leaf should have a proof that verifies against the roots."""
+        acc = UtreexoAccumulator()
+        leaves = [_leaf(i) for i in range(11)]
+        for leaf in leaves:
+            acc.add(leaf)
+        _assert_all_provable(acc, leaves)
+        assert not acc.verify(_leaf(99), acc.prove(leaves[3]))
+
+    def test_delete(self):
+        """Deleting leaves should keep the remaining leaves provable."""
+        acc = UtreexoAccumulator()
+        leaves = [_leaf(i) for i in range(11)]
+        for leaf in leaves:
+            acc.add(leaf)
+        for leaf in (leaves[2], leaves[10], leaves[0], leaves[5]):
+            acc.delete(leaf, acc.prove(leaf))
+            leaves.remove(leaf)
+            assert len(acc) == len(leaves)
+            assert len(acc.root()) == bin(len(leaves)).count('1')
+            _assert_all_provable(acc, leaves)
+
+    def test_delete_rejects_bad_proof(self):
+        """delete should raise ValueError if the proof does not verify."""
+        acc = UtreexoAccumulator()
+        for i in range(4):
+            acc.add(_leaf(i))
+        with pytest.raises(ValueError):
+            acc.delete(_leaf(0), acc.prove(_leaf(1)))
+
+
+# ---------------------------------------------------------------------------
+# BridgeUTXOSet Tests
+# ---------------------------------------------------------------------------
+
+class TestBridgeUTXOSet:
+    """Tests for BridgeUTXOSet."""
+
+    def test_tracks_adds_and_removes(self):
+        """The accumulator should hold exactly the set's UTXOs."""
+        utxo_set = BridgeUTXOSet()
+        output = TransactionOutput(value=1000, pubkey_script="aa" * 20)
+        for i in range(5):
+            utxo_set.add_utxo("ab" * 32, i, output, height=1)
+        utxo_set.remove_utxo("ab" * 32, 1)
+        assert utxo_set.remove_utxo_if_present("ab" * 32, 3) is True
+        assert utxo_set.remove_utxo_if_present("ab" * 32, 3) is False
+
+        assert len(utxo_set.accumulator) == utxo_set.size() == 3
+        for i in (0, 2, 4):
+            entry = utxo_set.get_utxo("ab" * 32, i)
+            leaf = utxo_leaf_hash("ab" * 32, i, entry)
+            assert utxo_set.accumulator.verify(leaf, utxo_set.prove_utxo("ab" * 32, i))
+        assert utxo_set.prove_utxo("ab" * 32, 1) is None
+
+    def test_copy_and_commit_keep_accumulator(self):
+        """copy() and overlay().commit() should carry the accumulator along."""
+        utxo_set = BridgeUTXOSet()
+        output = TransactionOutput(value=1000, pubkey_script="aa" * 20)
+        for i in range(5):
+            utxo_set.add_utxo("ab" * 32, i, output, height=1)
+        root = utxo_set.accumulator.root()
+
+        copy = utxo_set.copy()
+        assert isinstance(copy, BridgeUTXOSet)
+        assert copy.accumulator.root() == root
+        copy.remove_utxo("ab" * 32, 0)
+        assert copy.accumulator.root() != root
+        assert utxo_set.accumulator.root() == root
+
+        committed = utxo_set.overlay().commit()
+        assert isinstance(committed, BridgeUTXOSet)
+        assert committed.accumulator.root() == root
+        assert committed.prove_utxo("ab" * 32, 2) is not None
+
+        overlay = utxo_set.overlay()
+        overlay.remove_utxo("ab" * 32, 0)
+        committed = overlay.commit()
+        assert committed.accumulator.root() == copy.accumulator.root()
+        assert utxo_set.accumulator.root() == root
+
+    def test_blockchain_backend(self):
+        """A utreexo-backed chain should keep its accumulator in sync."""
+        blockchain = Blockchain(development_mode=True, commitment_backend="utreexo_bridge")
+        for _ in range(3):
+            blockchain.mine_next_block(coinbase_address="aa" * 20)
+        utxo_set = blockchain.utxo_set
+        assert isinstance(utxo_set, BridgeUTXOSet)
+        assert len(utxo_set.accumulator) == utxo_set.size()
+
+        tip = blockchain.get_chain_tip()
+        blockchain._unwind_block(tip)
+        assert len(utxo_set.accumulator) == utxo_set.size()
+
+    def test_export_keeps_backend(self, tmp_path):
+        """An exported bridge chain should reload as a bridge chain."""
+        blockchain = Blockchain(development_mode=True, commitment_backend="utreexo_bridge")
+        for _ in range(3):
+            blockchain.mine_next_block(coinbase_address="aa" * 20)
+        path = tmp_path / "chain.json"
+        blockchain.export_to_json(str(path))
+
+        restored = Blockchain.import_from_json(str(path))
+        assert isinstance(restored.utxo_set, BridgeUTXOSet)
+        assert restored.utxo_set.accumulator.root() == blockchain.utxo_set.accumulator.root()
+
+        plain = Blockchain(development_mode=True)
+        plain.export_to_json(str(path))
+        assert type(Blockchain.import_from_json(str(path)).utxo_set) is UTXOSet
+
+    def test_unknown_backend(self):
+        """Blockchain should reject an unknown commitment backend."""
+        with pytest.raises(ValueError):
+            Blockchain(commitment_backend="bogus")
@@ -8,11 +8,12 @@ Tests cover:
 - Balance calculation for addresses
 - Address-based UTXO lookups
 - Copying the UTXO set
+- Copy-on-write overlays
 """
 
 import pytest
 
-from src.core.utxo import UTXOSet, UTXOEntry
+from src.core.utxo import UTXOSet, UTXOEntry, UTXOOverlay
 from src.core.transaction import TransactionOutput
 
 
@@ -66,6 +67,12 @@ class TestUTXOSet:
         result = utxo_set.get_utxo("00" * 32, 0)
         assert result is None
 
+    def test_get_many(self, populated_utxo_set):
+        """get_many should return entries in order, with None for misses."""
+        txid = "ff" * 32
+        entries = populated_utxo_set.get_many([(txid, 1), (txid, 0)])
+        assert entries == [None, populated_utxo_set.get_utxo(txid, 0)]
+
     def test_has_utxo_false(self, utxo_set):
         """has_utxo should return False for nonexistent UTXOs."""
         assert utxo_set.has_utxo("00" * 32, 0) is False
@@ -77,6 +84,13 @@ class TestUTXOSet:
         assert removed is not None
         assert populated_utxo_set.has_utxo(txid, 0) is False
 
+    def test_remove_utxo_if_present(self, populated_utxo_set):
+        """remove_utxo_if_present should report whether anything was removed."""
+        txid = "ff" * 32
+        assert populated_utxo_set.remove_utxo_if_present(txid, 0) is True
+        assert populated_utxo_set.remove_utxo_if_present(txid, 0) is False
+        assert populated_utxo_set.has_utxo(txid, 0) is False
+
     def test_get_balance(self, utxo_set, sample_output):
         """get_balance should sum all UTXOs for an address (pubkey hash)."""
         address = "aa" * 20
@@ -108,6 +122,19 @@ class TestUTXOSet:
         values = {entry.value for _, _, entry in utxos}
         assert values == {100, 200}
 
+    def test_address_index_follows_removals(self, utxo_set):
+        """Balances and address queries should reflect removed and replaced UTXOs."""
+        address = "cc" * 20
+        utxo_set.add_utxo("ff" * 32, 0, TransactionOutput(100, address), height=1)
+        utxo_set.add_utxo("ee" * 32, 0, TransactionOutput(200, address), height=1)
+        utxo_set.remove_utxo("ff" * 32, 0)
+        assert utxo_set.get_balance(address) == 200
+        removed = utxo_set.apply_diff([("ee" * 32, 0)], [])
+        assert utxo_set.get_balance(address) == 0
+        assert utxo_set.get_utxos_for_address(address) == []
+        utxo_set.restore_utxo("ee" * 32, 0, removed[0])
+        assert utxo_set.get_utxos_for_address(address) == [("ee" * 32, 0, removed[0])]
+
     def test_get_utxos_for_address_empty(self, utxo_set):
         """Address with no UTXOs should return empty list."""
         utxos = utxo_set.get_utxos_for_address("dd" * 20)
@@ -126,6 +153,28 @@ class TestUTXOSet:
         assert copy.has_utxo(txid, 0) is False
         assert populated_utxo_set.has_utxo(txid, 0) is True
 
+    def test_copy_keeps_subclass(self, sample_output):
+        """copy() should return an instance of the set's own class."""
+        class TaggedSet(UTXOSet):
+            pass
+
+        tagged = TaggedSet()
+        tagged.add_utxo("ff" * 32, 0, sample_output, height=1)
+        copy = tagged.copy()
+        assert type(copy) is TaggedSet
+        assert copy.get_all_utxos() == tagged.get_all_utxos()
+
+    def test_copy_has_independent_index(self, populated_utxo_set):
+        """Address queries on a copy should not see the original's changes."""
+        copy = populated_utxo_set.copy()
+        balance = populated_utxo_set.get_balance("aa" * 20)
+        utxos = populated_utxo_set.get_utxos_for_address("aa" * 20)
+        for txid, index, _ in utxos:
+            copy.remove_utxo(txid, index)
+        assert copy.get_balance("aa" * 20) == 0
+        assert populated_utxo_set.get_balance("aa" * 20) == balance
+        assert len(populated_utxo_set.get_utxos_for_address("aa" * 20)) == len(utxos)
+
     def test_multiple_outputs_same_tx(self, utxo_set):
         """Multiple outputs from the same transaction should be tracked separately."""
         txid = "ff" * 32
@@ -138,3 +187,44 @@ class TestUTXOSet:
         assert utxo_set.has_utxo(txid, 1) is True
         assert utxo_set.get_utxo(txid, 0).value == 100
         assert utxo_set.get_utxo(txid, 1).value == 200
+
+
+# ---------------------------------------------------------------------------
+# UTXOOverlay Tests
+# ---------------------------------------------------------------------------
+
+class TestUTXOOverlay:
+    """Tests for the UTXOOverlay copy-on-write view."""
+
+    def test_changes_stay_in_overlay(self, populated_utxo_set, sample_output):
+        """Removals and additions through the overlay should not reach the base."""
+        txid = "ff" * 32
+        overlay = populated_utxo_set.overlay()
+        assert isinstance(overlay, UTXOOverlay)
+
+        assert overlay.remove_utxo_if_present(txid, 0) is True
+        assert overlay.remove_utxo_if_present(txid, 0) is False
+        overlay.add_utxo("ee" * 32, 0, sample_output, height=2)
+
+        assert overlay.has_utxo(txid, 0) is False
+        assert overlay.get_utxo("ee" * 32, 0).value == sample_output.value
+        assert len(overlay) == 1
+        assert populated_utxo_set.has_utxo(txid, 0) is True
+        assert populated_utxo_set.has_utxo("ee" * 32, 0) is False
+
+    def test_remove_missing_raises(self, utxo_set):
+        """Removing an unknown UTXO through the overlay should raise KeyError."""
+        with pytest.raises(KeyError):
+            utxo_set.overlay().remove_utxo("00" * 32, 0)
+
+    def test_commit(self, populated_utxo_set, sample_output):
+        """commit() should produce a new set with the overlay's changes applied."""
+        overlay = populated_utxo_set.overlay()
+        overlay.remove_utxo("ff" * 32, 0)
+        overlay.add_utxo("ee" * 32, 1, sample_output, height=2)
+
+        committed = overlay.commit()
+        assert committed.has_utxo("ff" * 32, 0) is False
+        assert committed.has_utxo("ee" * 32, 1) is True
+        assert committed.get_balance(sample_output.pubkey_script) == sample_output.value
+        assert populated_utxo_set.has_utxo("ff" * 32, 0) is True